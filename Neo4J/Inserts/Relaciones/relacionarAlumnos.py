@@ -29,10 +29,11 @@ from pathlib import Path
 from typing import Literal, Optional, Dict, List, Tuple
 import re
 from datetime import datetime
-import pandas as pd
 from neo4j import Driver, ManagedTransaction
 import logging
 
+from Neo4J.conn import NEO4J_DATABASE
+
 # Configuración de logging para seguimiento de operaciones
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,9 @@ TipoRelacion = Literal["Intento", "Completado", "Perfecto"]
 VALID_RELACIONES: set[str] = {"Intento", "Completado", "Perfecto"}
 VALID_NODOS: set[str] = {"Cuestionario", "Ayudantia"}
 
+# Fragmentos con que procesar_csv localiza sus columnas; el resto no se lee
+FRAGMENTOS_COLUMNAS_PROGRESO = ("correo", "estado", "comenz", "finaliz", "dur", "calific")
+
 # ----------------------------
 # Helpers: parseo de campos del CSV
 # ----------------------------
@@ -74,7 +78,7 @@ def obtener_actividades_bd(driver: Driver) -> Dict[str, List[str]]:
     actividades: Dict[str, List[str]] = {"cuestionarios": [], "ayudantias": []}
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             # Obtener cuestionarios
             result_c = session.run("MATCH (c:Cuestionario) RETURN c.nombre as nombre")
             actividades["cuestionarios"] = [record["nombre"] for record in result_c if record["nombre"]]
@@ -139,6 +143,24 @@ def limpiar_nombre_archivo_relaciones(nombre_archivo: str) -> Optional[str]:
         logger.error(f"Error limpiando nombre para relaciones '{nombre_archivo}': {e}")
         return None
 
+def texto_celda(valor: Optional[object]) -> str:
+    """
+    Convierte una celda del CSV a texto limpio, tratando nulos como vacío.
+    
+    Args:
+        valor: Valor de la celda (None si la columna no existe)
+        
+    Returns:
+        str: Texto sin espacios en los extremos, o "" si la celda es nula o 'nan'
+    """
+    if valor is None:
+        return ""
+    texto = str(valor)
+    if texto in ('nan', 'NaN'):
+        return ""
+    return texto.strip()
+
+
 def parse_fecha_a_iso(fecha_str: str) -> Optional[str]:
     """
     Convierte una fecha en formato español a formato ISO 8601.
@@ -261,7 +283,7 @@ def verificar_estado_relaciones(driver: Driver) -> None:
     Proporciona un reporte detallado de las relaciones existentes,
     incluyendo conteos por tipo y distribución de relaciones alumno-actividades.
     """
-    with driver.session() as session:
+    with driver.session(database=NEO4J_DATABASE) as session:
         # Contar relaciones totales
         result = session.run("""
             MATCH ()-[r]->() 
@@ -476,7 +498,7 @@ def obtener_lista_alumnos(driver: Driver) -> list[str]:
         list[str]: Lista de correos electrónicos de alumnos existentes
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run("MATCH (al:Alumno) RETURN al.correo AS correo")
             alumnos = [row["correo"].strip().lower() for row in result if row["correo"]]
             logger.info(f"Encontrados {len(alumnos)} alumnos en la base de datos")
@@ -673,9 +695,17 @@ def procesar_csv(driver: Driver, recurso_path: Path, actividades_bd: Dict[str, L
         logger.error(f"Archivo no existe: {recurso_path}")
         return
     
+    import pandas as pd  # diferido: solo lo necesita la lectura de CSV
+
     try:
-        # Leer el CSV con type ignore para el warning específico
-        df = pd.read_csv(recurso_path)  # type: ignore
+        # Solo las columnas que se buscan abajo, como texto y sin NaN: evita
+        # inferir tipos y construir columnas (respuestas, etc.) que no se usan
+        df = pd.read_csv(  # type: ignore
+            recurso_path,
+            usecols=lambda columna: any(f in columna.lower() for f in FRAGMENTOS_COLUMNAS_PROGRESO),
+            dtype=str,
+            keep_default_na=False,
+        )
         logger.info(f"CSV leído - {len(df)} filas, columnas: {list(df.columns)}")
     except Exception as e:
         logger.error(f"Error leyendo CSV: {e}")
@@ -709,9 +739,14 @@ def procesar_csv(driver: Driver, recurso_path: Path, actividades_bd: Dict[str, L
     col_duracion = next((c for c in df.columns if "dur" in c.lower()), None)
     col_calificacion = next((c for c in df.columns if "calific" in c.lower()), None)
 
-    # Preparar datos de alumnos
-    df[col_correo] = df[col_correo].astype(str)
-    csv_correos = {str(row[col_correo]).strip().lower() for _, row in df.iterrows() if str(row[col_correo]).strip()}
+    # Preparar datos de alumnos: el correo se normaliza una vez para toda la
+    # columna y cada alumno queda en una sola fila (la primera, como antes)
+    df[col_correo] = df[col_correo].astype(str).str.strip().str.lower()
+    filas_csv = len(df)
+    df = df.drop_duplicates(subset=col_correo, keep="first")
+    if len(df) < filas_csv:
+        logger.info("%s filas con correo repetido descartadas en %s", filas_csv - len(df), recurso_path.name)
+    csv_correos = {correo for correo in df[col_correo] if correo}
 
     alumnos_bd = obtener_lista_alumnos(driver)
 
@@ -725,34 +760,32 @@ def procesar_csv(driver: Driver, recurso_path: Path, actividades_bd: Dict[str, L
     alumnos_procesados = 0
     errores = 0
 
-    # Procesar cada alumno encontrado
-    for correo in alumnos_comunes:
-        try:
-            alumno_data = df[df[col_correo].str.strip().str.lower() == correo]
-            if alumno_data.empty:
-                continue
+    # Una sola selección de las filas de alumnos existentes y recorrido por
+    # columnas ya extraídas a listas: sin filtrar el DataFrame ni construir
+    # una Series por alumno
+    seleccion = df[df[col_correo].isin(alumnos_comunes)]
 
-            serie = alumno_data.iloc[0]
+    def valores(columna: Optional[str]) -> List[Optional[str]]:
+        return seleccion[columna].tolist() if columna else [None] * len(seleccion)
 
+    filas = zip(
+        seleccion[col_correo].tolist(),
+        valores(col_estado),
+        valores(col_comenzado),
+        valores(col_finalizado),
+        valores(col_duracion),
+        valores(col_calificacion),
+    )
+
+    # Procesar cada alumno encontrado
+    for correo, estado_val, comenzado_val, finalizado_val, duracion_val, calificacion_val in filas:
+        try:
             # Parsear campos del progreso del alumno
-            estado_val = serie[col_estado] if col_estado else None
-            estado = str(estado_val).strip() if estado_val is not None and str(estado_val) != 'nan' and str(estado_val) != 'NaN' else ""
-            
-            comenzado_val = serie[col_comenzado] if col_comenzado else None
-            comenzado_str = str(comenzado_val).strip() if comenzado_val is not None and str(comenzado_val) != 'nan' and str(comenzado_val) != 'NaN' else ""
-            start_iso = parse_fecha_a_iso(comenzado_str)
-            
-            finalizado_val = serie[col_finalizado] if col_finalizado else None
-            finalizado_str = str(finalizado_val).strip() if finalizado_val is not None and str(finalizado_val) != 'nan' and str(finalizado_val) != 'NaN' else ""
-            end_iso = parse_fecha_a_iso(finalizado_str)
-            
-            duracion_val = serie[col_duracion] if col_duracion else None
-            duracion_str = str(duracion_val).strip() if duracion_val is not None and str(duracion_val) != 'nan' and str(duracion_val) != 'NaN' else ""
-            duration_seconds = parse_duracion_a_segundos(duracion_str)
-            
-            calificacion_val = serie[col_calificacion] if col_calificacion else None
-            calificacion_str = str(calificacion_val).strip() if calificacion_val is not None and str(calificacion_val) != 'nan' and str(calificacion_val) != 'NaN' else ""
-            score = parse_calificacion_a_float(calificacion_str)
+            estado = texto_celda(estado_val)
+            start_iso = parse_fecha_a_iso(texto_celda(comenzado_val))
+            end_iso = parse_fecha_a_iso(texto_celda(finalizado_val))
+            duration_seconds = parse_duracion_a_segundos(texto_celda(duracion_val))
+            score = parse_calificacion_a_float(texto_celda(calificacion_val))
 
             # Determinar tipo de relación basado en estado y calificación
             tipo_relacion: TipoRelacion = "Intento"
@@ -765,7 +798,7 @@ def procesar_csv(driver: Driver, recurso_path: Path, actividades_bd: Dict[str, L
             funcion_relacion = relacionar_alumno_cuestionario if tipo_recurso == "Cuestionario" else relacionar_alumno_ayudantia
             
             # Crear relación en la base de datos
-            with driver.session() as session:
+            with driver.session(database=NEO4J_DATABASE) as session:
                 session.execute_write(funcion_relacion, correo, nombre_actividad, tipo_relacion,
                                       start_iso, end_iso, duration_seconds, score, estado)
             
@@ -8,9 +8,10 @@ base de datos, identificando discrepancias y problemas de integridad.
 
 Funciones principales:
     - procesar_relaciones: Proceso principal de validación masiva
-    - relacionar_unidad_rap: Validación individual de pares unidad-RAP
+    - validar_unidad_y_raps: Validación en una consulta de una unidad y todos sus RAPs
     - verificar_estado_base_datos: Consulta del estado actual de la BD
-    - Funciones auxiliares para escaneo de archivos y directorios
+    - recorrer_unidades: Recorrido único (os.scandir) de unidades, RAPs y PDFs
+    - Funciones auxiliares para escaneo de archivos y directorios (os.scandir)
 
 Características:
     - Validación bidireccional entre sistema de archivos y base de datos
@@ -25,70 +26,58 @@ Estructura de validación:
     - Relaciones: Correspondencia entre unidades y RAPs en Neo4J
 """
 
+import os
 from pathlib import Path
-from typing import Tuple, List
+from typing import Dict, Iterator, Tuple, List, Optional, Sequence, Set, Union
 from neo4j import Driver, ManagedTransaction
 import logging
 
+from Neo4J.conn import NEO4J_DATABASE
+
 # Configuración de logging para seguimiento de operaciones
 logger = logging.getLogger(__name__)
 
 
 # ==========================
-# Función: Validar existencia de Unidad y RAP
+# Función: Validar existencia de Unidad y sus RAPs
 # ==========================
 
-def relacionar_unidad_rap(tx: ManagedTransaction, unidad: str, rap: str) -> Tuple[bool, bool]:
+def validar_unidad_y_raps(tx: ManagedTransaction, unidad: str, raps: List[str]) -> Tuple[bool, Set[str]]:
     """
-    Valida que existan los nodos (:Unidad {nombre: unidad}) y (:RAP {nombre: rap}) en Neo4J.
+    Valida en una sola consulta la unidad y todos sus RAPs.
     
-    Realiza una consulta optimizada que verifica simultáneamente la existencia de
-    ambos nodos usando OPTIONAL MATCH para manejar casos donde uno o ambos no existan.
+    Envía la lista completa de RAPs de la unidad y la filtra con
+    `r.nombre IN $raps`, de modo que la validación de una unidad cuesta un
+    único viaje de ida y vuelta a Neo4J en lugar de uno por archivo PDF. Si la
+    unidad no existe, los RAPs no se buscan.
     
     Args:
         tx: Transacción activa de Neo4J para ejecutar la consulta
         unidad: Nombre de la unidad a validar (debe coincidir exactamente)
-        rap: Nombre del RAP a validar (debe coincidir exactamente)
+        raps: Nombres de los RAPs a validar
         
     Returns:
-        Tuple[bool, bool]: Tupla con (unidad_existe, rap_existe) indicando
-                          la existencia de cada nodo individualmente
+        Tuple[bool, Set[str]]: (unidad_existe, nombres de `raps` que existen en BD).
+                               Si la unidad no existe, el conjunto viene vacío.
         
     Raises:
-        Exception: Si hay error en la consulta a la base de datos por problemas
-                   de conexión, sintaxis de query, o permisos insuficientes
-                   
+        Exception: Si hay error en la consulta a la base de datos
+        
     Example:
         >>> with driver.session() as session:
-        ...     unidad_existe, rap_existe = session.execute_write(
-        ...         relacionar_unidad_rap, "Unidad_01", "Introduccion_Programacion"
-        ...     )
-        >>> print(f"Unidad existe: {unidad_existe}, RAP existe: {rap_existe}")
-        Unidad existe: True, RAP existe: True
-        
-    Note:
-        - Consulta case-sensitive: los nombres deben coincidir exactamente
-        - Usa OPTIONAL MATCH para manejar nodos faltantes gracefulmente
-        - Retorna (False, False) si la consulta no retorna resultados
-        - Útil para validación pre-relacional y debugging
+        ...     session.execute_read(validar_unidad_y_raps, "Unidad_01", ["RAP_1", "RAP_3"])
+        (True, {'RAP_1'})
     """
-    try:
-        query = """
-        MATCH (u:Unidad {nombre: $unidad})
-        OPTIONAL MATCH (r:RAP {nombre: $rap})
-        RETURN u IS NOT NULL AS unidad_existe, r IS NOT NULL AS rap_existe
-        """
-        result = tx.run(query, unidad=unidad, rap=rap).single()
-        if result is None:
-            return (False, False)
-        
-        unidad_existe: bool = bool(result["unidad_existe"])
-        rap_existe: bool = bool(result["rap_existe"])
-        return (unidad_existe, rap_existe)
-        
-    except Exception as e:
-        logger.error(f"❌ Error validando unidad '{unidad}' y RAP '{rap}': {e}")
-        raise
+    query = """
+    OPTIONAL MATCH (u:Unidad {nombre: $unidad})
+    OPTIONAL MATCH (r:RAP)
+    WHERE u IS NOT NULL AND r.nombre IN $raps
+    RETURN u IS NOT NULL AS unidad_existe, collect(r.nombre) AS encontrados
+    """
+    record = tx.run(query, unidad=unidad, raps=raps).single()
+    if record is None:
+        return (False, set())
+    return (bool(record["unidad_existe"]), set(record["encontrados"]))
 
 
 # ==========================
@@ -124,39 +113,84 @@ def encontrar_carpetas_unidad(base_path: Path) -> List[Path]:
         - Retorna lista vacía si no se encuentran unidades
         - Orden natural según iteración del sistema de archivos
     """
-    if not base_path.exists():
-        raise FileNotFoundError(f"La ruta base no existe: {base_path}")
-    
-    if not base_path.is_dir():
-        raise FileNotFoundError(f"La ruta base no es un directorio: {base_path}")
+    return [Path(entrada.path) for entrada in escanear_carpetas_unidad(base_path)]
+
 
-    carpetas_unidad = [
-        carpeta for carpeta in base_path.iterdir()
-        if carpeta.is_dir() and carpeta.name.lower().startswith("unidad")
-    ]
+def escanear_carpetas_unidad(base_path: Union[str, Path]) -> List[os.DirEntry[str]]:
+    """
+    Versión de encontrar_carpetas_unidad que retorna las entradas de os.scandir.
+    
+    La usa procesar_relaciones para recorrer las unidades con cadenas
+    (DirEntry.path / DirEntry.name) sin construir un Path por carpeta;
+    encontrar_carpetas_unidad convierte a Path solo en la API pública.
+    
+    Args:
+        base_path: Ruta base del sistema de archivos a escanear
+        
+    Returns:
+        List[os.DirEntry[str]]: Entradas de las carpetas de unidad
+        
+    Raises:
+        FileNotFoundError: Si la ruta base no existe o no es un directorio
+    """
+    # os.scandir entrega el tipo de cada entrada desde la propia lectura del
+    # directorio, sin un stat() adicional por hijo como Path.iterdir + is_dir
+    try:
+        with os.scandir(base_path) as entradas:
+            return [
+                entrada for entrada in entradas
+                if entrada.is_dir() and entrada.name.lower().startswith("unidad")
+            ]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"La ruta base no existe: {base_path}") from None
+    except NotADirectoryError:
+        raise FileNotFoundError(f"La ruta base no es un directorio: {base_path}") from None
+
+
+def encontrar_carpeta_rap(unidad_dir: Union[str, Path]) -> Optional[os.DirEntry[str]]:
+    """
+    Localiza la subcarpeta "RAP" de una unidad con una sola lectura del directorio.
     
-    return carpetas_unidad
+    Usa os.scandir sobre la carpeta de la unidad: el tipo de cada entrada viene
+    incluido en la lectura del directorio, por lo que no se necesitan llamadas
+    separadas a exists()/is_dir().
+    
+    Args:
+        unidad_dir: Ruta del directorio de la unidad
+        
+    Returns:
+        Optional[os.DirEntry[str]]: Entrada de la carpeta RAP, o None si no existe
+        
+    Example:
+        >>> encontrar_carpeta_rap(Path("/ruta/Unidad_01")).path
+        '/ruta/Unidad_01/RAP'
+    """
+    with os.scandir(unidad_dir) as entradas:
+        for entrada in entradas:
+            if entrada.name == "RAP" and entrada.is_dir():
+                return entrada
+    return None
 
 
-def encontrar_archivos_pdf_en_rap(carpeta_rap: Path) -> List[Path]:
+def encontrar_archivos_pdf_en_rap(carpeta_rap: Union[str, Path]) -> List[os.DirEntry[str]]:
     """
     Encuentra todos los archivos PDF en una carpeta RAP específica.
     
-    Escanea recursivamente el directorio RAP en busca de archivos PDF que
-    representan los recursos de aprendizaje. Los archivos se retornan ordenados
+    Escanea el directorio RAP con os.scandir en busca de archivos PDF que
+    representan los recursos de aprendizaje. Las entradas se retornan ordenadas
     alfabéticamente para procesamiento consistente.
     
     Args:
-        carpeta_rap: Path del directorio RAP a escanear
+        carpeta_rap: Ruta del directorio RAP a escanear
         
     Returns:
-        List[Path]: Lista ordenada de paths de archivos PDF encontrados,
-                   o lista vacía si no hay PDFs o la carpeta no existe
+        List[os.DirEntry[str]]: Lista ordenada de entradas PDF encontradas,
+                               o lista vacía si no hay PDFs o la carpeta no existe
         
     Example:
-        >>> pdfs = encontrar_archivos_pdf_en_rap(Path("/ruta/Unidad_01/RAP"))
+        >>> pdfs = encontrar_archivos_pdf_en_rap("/ruta/Unidad_01/RAP")
         >>> [pdf.name for pdf in pdfs]
-        ['RAP_1.pdf', 'RAP_2.pdf', 'Guia_Estudio.pdf']
+        ['Guia_Estudio.pdf', 'RAP_1.pdf', 'RAP_2.pdf']
         
     Note:
         - Solo busca archivos con extensión .pdf (case-insensitive)
@@ -164,31 +198,71 @@ def encontrar_archivos_pdf_en_rap(carpeta_rap: Path) -> List[Path]:
         - Ordena archivos alfabéticamente por nombre
         - No busca recursivamente en subdirectorios
     """
-    if not carpeta_rap.exists() or not carpeta_rap.is_dir():
+    try:
+        with os.scandir(carpeta_rap) as entradas:
+            archivos_pdf = [
+                entrada for entrada in entradas
+                if entrada.is_file() and entrada.name.lower().endswith(".pdf")
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
+
+    archivos_pdf.sort(key=lambda entrada: entrada.name)
+    return archivos_pdf
+
+
+def recorrer_unidades(
+    carpetas_unidad: Sequence[Union[Path, os.DirEntry[str]]]
+) -> Iterator[Tuple[str, Optional[os.DirEntry[str]], List[os.DirEntry[str]]]]:
+    """
+    Recorre las unidades y entrega, por cada una, su carpeta RAP y sus PDFs.
+    
+    Es el único recorrido del sistema de archivos que hace la validación: cada
+    unidad se lee una vez para encontrar "RAP" y la carpeta RAP una vez para
+    listar los PDFs. Se entregan objetos os.DirEntry, cuyo tipo (is_dir/is_file)
+    ya viene de la lectura del directorio, en lugar de construir Paths nuevos.
     
-    return sorted([
-        archivo for archivo in carpeta_rap.iterdir()
-        if archivo.is_file() and archivo.suffix.lower() == ".pdf"
-    ])
+    Args:
+        carpetas_unidad: Carpetas de unidad a recorrer (Path o os.DirEntry)
+        
+    Yields:
+        Tuple[str, Optional[os.DirEntry[str]], List[os.DirEntry[str]]]:
+            (nombre_unidad, carpeta_rap, archivos_pdf). carpeta_rap es None si
+            la unidad no tiene carpeta RAP.
+        
+    Example:
+        >>> for nombre, rap, pdfs in recorrer_unidades(carpetas):
+        ...     print(nombre, rap is not None, len(pdfs))
+        Unidad_01 True 5
+    """
+    for unidad_dir in carpetas_unidad:
+        try:
+            carpeta_rap = encontrar_carpeta_rap(unidad_dir)
+            archivos_pdf = encontrar_archivos_pdf_en_rap(carpeta_rap.path) if carpeta_rap else []
+        except OSError as e:
+            logger.error("❌ Error leyendo la unidad %s: %s", unidad_dir.name, e)
+            continue
+        yield (unidad_dir.name, carpeta_rap, archivos_pdf)
 
 
 def procesar_unidad(
     driver: Driver, 
-    unidad_dir: Path, 
-    unidad_nombre: str
+    unidad_nombre: str,
+    carpeta_rap: Optional[os.DirEntry[str]],
+    archivos_pdf: List[os.DirEntry[str]]
 ) -> Tuple[int, int, int, int]:
     """
     Procesa una unidad individual, validando todos sus RAPs contra la base de datos.
     
-    Función que coordina la validación completa de una unidad: encuentra todos
-    los archivos PDF en su carpeta RAP y verifica la existencia correspondiente
-    tanto de la unidad como de cada RAP en la base de datos Neo4J.
+    Función que coordina la validación completa de una unidad: recibe los
+    archivos PDF de su carpeta RAP (ver recorrer_unidades) y verifica la
+    existencia correspondiente tanto de la unidad como de cada RAP en Neo4J.
     
     Args:
         driver: Driver de conexión a Neo4J para ejecutar las validaciones
-        unidad_dir: Directorio físico de la unidad en el sistema de archivos
         unidad_nombre: Nombre de la unidad (debe coincidir con el nombre en BD)
+        carpeta_rap: Entrada de la carpeta RAP de la unidad, o None si no existe
+        archivos_pdf: Entradas de los archivos PDF de la carpeta RAP
         
     Returns:
         Tuple[int, int, int, int]: Métricas de procesamiento en el orden:
@@ -198,7 +272,7 @@ def procesar_unidad(
             - raps_omitidos: Número de RAPs que no pudieron procesarse por error
         
     Example:
-        >>> metrics = procesar_unidad(driver, Path("/ruta/Unidad_01"), "Unidad_01")
+        >>> metrics = procesar_unidad(driver, "Unidad_01", carpeta_rap, archivos_pdf)
         📁 Procesando unidad: Unidad_01 (3 RAPs encontrados)
         ✅ Nodo validado: 'Unidad_01' y 'RAP_1'
         ❌ RAP NO existe en Neo4j: RAP_3 (archivo: rap_3.pdf)
@@ -206,9 +280,10 @@ def procesar_unidad(
         (2, 1, 0, 0)
         
     Note:
-        - Continúa el procesamiento despite errores individuales por RAP
-        - Considera que una unidad no existe solo si falla para todos sus RAPs
-        - Los RAPs omitidos son aquellos que generaron excepciones durante el procesamiento
+        - Valida la unidad y todos sus RAPs en una sola consulta (validar_unidad_y_raps)
+        - Si la unidad no existe, la cuenta una sola vez y marca todos sus RAPs
+          como omitidos
+        - Si la consulta por lotes falla, todos los RAPs de la unidad cuentan como omitidos
         - Logging detallado de cada validación individual
     """
     relaciones_validas = 0
@@ -216,43 +291,42 @@ def procesar_unidad(
     unidades_no_existentes = 0
     raps_omitidos = 0
 
-    rap_folder: Path = unidad_dir / "RAP"
-    if not rap_folder.exists() or not rap_folder.is_dir():
-        logger.warning(f"⚠️ Carpeta RAP no encontrada en {unidad_dir}")
+    if carpeta_rap is None:
+        logger.warning("⚠️ Carpeta RAP no encontrada en %s", unidad_nombre)
         return (relaciones_validas, raps_no_existentes, unidades_no_existentes, raps_omitidos)
 
-    archivos_pdf = encontrar_archivos_pdf_en_rap(rap_folder)
     if not archivos_pdf:
-        logger.warning(f"⚠️ No se encontraron PDFs en {rap_folder}")
+        logger.warning("⚠️ No se encontraron PDFs en %s", carpeta_rap.path)
         return (relaciones_validas, raps_no_existentes, unidades_no_existentes, raps_omitidos)
 
-    logger.info(f"📁 Procesando unidad: {unidad_nombre} ({len(archivos_pdf)} RAPs encontrados)")
+    logger.info("📁 Procesando unidad: %s (%s RAPs encontrados)", unidad_nombre, len(archivos_pdf))
 
-    for pdf in archivos_pdf:
-        try:
-            rap_nombre: str = pdf.stem
-            
-            with driver.session() as session:
-                unidad_existe: bool
-                rap_existe: bool
-                unidad_existe, rap_existe = session.execute_write(relacionar_unidad_rap, unidad_nombre, rap_nombre)
-
-            if unidad_existe and rap_existe:
-                logger.info(f"   ✅ Nodo validado: '{unidad_nombre}' y '{rap_nombre}'")
-                relaciones_validas += 1
-            else:
-                if not unidad_existe:
-                    logger.error(f"   ❌ Unidad NO existe en Neo4j: {unidad_nombre}")
-                    unidades_no_existentes += 1
-                if not rap_existe:
-                    logger.error(f"   ❌ RAP NO existe en Neo4j: {rap_nombre} (archivo: {pdf.name})")
-                    raps_no_existentes += 1
-                    raps_omitidos += 1
-                    
-        except Exception as e:
-            logger.error(f"❌ Error procesando RAP {pdf.name} en unidad {unidad_nombre}: {e}")
+    archivos_por_rap: Dict[str, str] = {pdf.name.rpartition(".")[0]: pdf.name for pdf in archivos_pdf}
+
+    try:
+        with driver.session(database=NEO4J_DATABASE) as session:
+            unidad_existe, raps_encontrados = session.execute_read(
+                validar_unidad_y_raps, unidad_nombre, list(archivos_por_rap)
+            )
+    except Exception as e:
+        logger.error("❌ Error validando RAPs de la unidad %s: %s", unidad_nombre, e)
+        raps_omitidos += len(archivos_pdf)
+        return (relaciones_validas, raps_no_existentes, unidades_no_existentes, raps_omitidos)
+
+    if not unidad_existe:
+        logger.error("   ❌ Unidad NO existe en Neo4j: %s", unidad_nombre)
+        unidades_no_existentes += 1
+        raps_omitidos += len(archivos_pdf)
+        return (relaciones_validas, raps_no_existentes, unidades_no_existentes, raps_omitidos)
+
+    for rap_nombre, archivo in archivos_por_rap.items():
+        if rap_nombre in raps_encontrados:
+            logger.info("   ✅ Nodo validado: '%s' y '%s'", unidad_nombre, rap_nombre)
+            relaciones_validas += 1
+        else:
+            logger.error("   ❌ RAP NO existe en Neo4j: %s (archivo: %s)", rap_nombre, archivo)
+            raps_no_existentes += 1
             raps_omitidos += 1
-            continue
 
     return (relaciones_validas, raps_no_existentes, unidades_no_existentes, raps_omitidos)
 
@@ -302,17 +376,17 @@ def procesar_relaciones(driver: Driver, base_path: Path) -> None:
         - Advertencias específicas para problemas identificados
         - Útil para verificar integridad después de inserciones masivas
     """
-    logger.info(f"🔍 Iniciando procesamiento de relaciones en: {base_path}")
+    logger.info("🔍 Iniciando procesamiento de relaciones en: %s", base_path)
 
     try:
-        carpetas_unidad = encontrar_carpetas_unidad(base_path)
+        carpetas_unidad = escanear_carpetas_unidad(base_path)
     except FileNotFoundError as e:
-        logger.error(f"❌ {e}")
+        logger.error("❌ %s", e)
         raise
 
     if not carpetas_unidad:
         error_msg = f"No se encontraron carpetas de Unidad en: {base_path}"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         raise ValueError(error_msg)
 
     unidades_procesadas: int = 0
@@ -321,13 +395,12 @@ def procesar_relaciones(driver: Driver, base_path: Path) -> None:
     total_unidades_no_existentes: int = 0
     total_raps_omitidos: int = 0
 
-    for unidad_dir in carpetas_unidad:
+    for unidad_nombre, carpeta_rap, archivos_pdf in recorrer_unidades(carpetas_unidad):
         try:
-            unidad_nombre: str = unidad_dir.name
             unidades_procesadas += 1
 
             relaciones_validas, raps_no_existentes, unidades_no_existentes, raps_omitidos = procesar_unidad(
-                driver, unidad_dir, unidad_nombre
+                driver, unidad_nombre, carpeta_rap, archivos_pdf
             )
 
             total_relaciones_validas += relaciones_validas
@@ -336,25 +409,31 @@ def procesar_relaciones(driver: Driver, base_path: Path) -> None:
             total_raps_omitidos += raps_omitidos
 
         except Exception as e:
-            logger.error(f"❌ Error procesando unidad {unidad_dir.name}: {e}")
+            logger.error("❌ Error procesando unidad %s: %s", unidad_nombre, e)
             continue
 
-    # Reporte final comprehensivo
-    logger.info("\n" + "="*50)
-    logger.info("📊 RESUMEN DE PROCESAMIENTO")
-    logger.info("="*50)
-    logger.info(f"🗂️  Unidades procesadas: {unidades_procesadas}")
-    logger.info(f"✅  Relaciones validadas: {total_relaciones_validas}")
-    logger.info(f"❌  Unidades no encontradas en BD: {total_unidades_no_existentes}")
-    logger.info(f"❌  RAPs no encontrados en BD: {total_raps_no_existentes}")
-    logger.info(f"⏭️  RAPs omitidos: {total_raps_omitidos}")
+    # Reporte final comprehensivo, emitido como un único registro
+    logger.info(
+        "\n%s\n📊 RESUMEN DE PROCESAMIENTO\n%s\n"
+        "🗂️  Unidades procesadas: %s\n"
+        "✅  Relaciones validadas: %s\n"
+        "❌  Unidades no encontradas en BD: %s\n"
+        "❌  RAPs no encontrados en BD: %s\n"
+        "⏭️  RAPs omitidos: %s",
+        "="*50, "="*50,
+        unidades_procesadas,
+        total_relaciones_validas,
+        total_unidades_no_existentes,
+        total_raps_no_existentes,
+        total_raps_omitidos,
+    )
     
     # Advertencias específicas para problemas identificados
     if total_unidades_no_existentes > 0:
-        logger.warning(f"⚠️  Se encontraron {total_unidades_no_existentes} unidades que no existen en la base de datos")
+        logger.warning("⚠️  Se encontraron %s unidades que no existen en la base de datos", total_unidades_no_existentes)
     
     if total_raps_no_existentes > 0:
-        logger.warning(f"⚠️  Se encontraron {total_raps_no_existentes} RAPs que no existen en la base de datos")
+        logger.warning("⚠️  Se encontraron %s RAPs que no existen en la base de datos", total_raps_no_existentes)
 
 
 # ==========================
@@ -393,7 +472,7 @@ def verificar_estado_base_datos(driver: Driver) -> dict[str, int]:
         - Útil para comparar con el estado del sistema de archivos
         - Las relaciones deben igualar a RAPs si la integridad es perfecta
     """
-    with driver.session() as session:
+    with driver.session(database=NEO4J_DATABASE) as session:
         try:
             # Contar unidades totales
             result_unidades = session.run("MATCH (u:Unidad) RETURN count(u) as total")
@@ -417,5 +496,5 @@ def verificar_estado_base_datos(driver: Driver) -> dict[str, int]:
             }
             
         except Exception as e:
-            logger.error(f"❌ Error verificando estado de la base de datos: {e}")
+            logger.error("❌ Error verificando estado de la base de datos: %s", e)
             return {"unidades": 0, "raps": 0, "relaciones": 0}
\ No newline at end of file
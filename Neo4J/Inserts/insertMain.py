@@ -26,19 +26,33 @@ Estructura de datos manejada:
 """
 
 import os
+import queue
+import importlib.util
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict, Any
-import pandas as pd
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from neo4j import Driver
 
-from Neo4J.conn import obtener_driver
+from Neo4J.conn import (
+    NEO4J_DATABASE,
+    RESTRICCIONES_ESQUEMA,
+    cerrar_driver,
+    crear_restricciones_esquema,
+    obtener_driver,
+)
 
 # ==========================
 # Importar módulos internos
 # ==========================
-from Neo4J.Inserts.insertarAlumnos import insertar_alumno, limpiar_bd
+from Neo4J.Inserts.insertarAlumnos import (
+    COLUMNAS_CSV_ALUMNOS,
+    COLUMNAS_REQUERIDAS_ALUMNOS,
+    insertar_alumno,
+    limpiar_bd,
+)
 from Neo4J.Inserts.insertarMaterial import procesar_unidades_y_raps
 from Neo4J.Inserts.insertarCuestionariosAyudantias import procesar_cuestionarios_y_ayudantias
 from Neo4J.Inserts.Relaciones.relacionarAlumnos import relacionar_alumnos
@@ -57,10 +71,156 @@ if not BASE_PATH.exists():
 
 logger = logging.getLogger(__name__)
 
+# ==========================
+# Logging fuera del hilo de trabajo
+# ==========================
+
+# Estado del logging en cola: (listener, handlers originales del logger raíz,
+# nivel original del logger raíz), para restaurarlo al terminar
+EstadoLoggingCola = Tuple[QueueListener, List[logging.Handler], int]
+
+
+def nivel_log_desde_entorno() -> int:
+    """
+    Lee el nivel de logging de la variable de entorno LOG_LEVEL.
+    
+    Returns:
+        int: Nivel de logging; WARNING si LOG_LEVEL no está definida o no es
+             un nombre de nivel válido (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    """
+    nivel = logging.getLevelName(os.getenv("LOG_LEVEL", "WARNING").strip().upper())
+    return nivel if isinstance(nivel, int) else logging.WARNING
+
+
+def iniciar_logging_en_cola() -> EstadoLoggingCola:
+    """
+    Redirige el logging a una cola atendida por un hilo dedicado.
+    
+    Los módulos de inserción registran un mensaje por unidad, RAP o archivo.
+    Con un QueueHandler, cada logger.info(...) formatea el mensaje en el hilo
+    que lo emite (QueueHandler.prepare) y lo encola; la escritura en los
+    handlers reales la hace un único QueueListener en segundo plano, de modo
+    que la E/S del log no bloquea a los hilos que hablan con Neo4J.
+    
+    Los handlers ya configurados en el logger raíz pasan a ser atendidos por el
+    listener. Si no hay ninguno, se usa un StreamHandler con nivel LOG_LEVEL
+    (variable de entorno, por defecto WARNING) solo mientras dure la cola.
+    
+    Returns:
+        EstadoLoggingCola: Listener en ejecución y configuración original del
+                           logger raíz; debe pasarse a detener_logging_en_cola()
+        
+    Example:
+        >>> estado = iniciar_logging_en_cola()
+        >>> try:
+        ...     procesar_relaciones(driver, BASE_PATH)
+        ... finally:
+        ...     detener_logging_en_cola(estado)
+    """
+    raiz = logging.getLogger()
+    handlers_originales = list(raiz.handlers)
+    nivel_original = raiz.level
+
+    handlers_reales = list(handlers_originales)
+    if not handlers_reales:
+        handler_consola = logging.StreamHandler()
+        handler_consola.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        handlers_reales.append(handler_consola)
+        raiz.setLevel(nivel_log_desde_entorno())
+
+    cola: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(cola, *handlers_reales, respect_handler_level=True)
+    raiz.handlers = [QueueHandler(cola)]
+    listener.start()
+    return listener, handlers_originales, nivel_original
+
+
+def detener_logging_en_cola(estado: EstadoLoggingCola) -> None:
+    """
+    Vacía la cola de logging y restaura los handlers y el nivel originales del logger raíz.
+    
+    Args:
+        estado: Valor retornado por iniciar_logging_en_cola()
+    """
+    listener, handlers_originales, nivel_original = estado
+    listener.stop()
+    raiz = logging.getLogger()
+    raiz.handlers = handlers_originales
+    raiz.setLevel(nivel_original)
+
+
 # ==========================
 # Funciones para estadísticas
 # ==========================
 
+# Estadísticas leídas de los contadores internos de Neo4J (requiere APOC)
+CONSULTA_ESTADISTICAS_APOC = """
+    CALL apoc.meta.stats() YIELD nodeCount, relCount, labels
+    RETURN
+        nodeCount as total_nodos,
+        coalesce(labels.Alumno, 0) as total_alumnos,
+        coalesce(labels.Unidad, 0) as total_unidades,
+        coalesce(labels.RAP, 0) as total_raps,
+        coalesce(labels.Cuestionario, 0) as total_cuestionarios,
+        coalesce(labels.Ayudantia, 0) as total_ayudantias,
+        relCount as total_relaciones
+"""
+
+# Alternativa sin APOC: contadores del store vía procedimiento integrado
+# (requiere permisos de administrador en algunas ediciones)
+CONSULTA_ESTADISTICAS_GRAPH_COUNTS = "CALL db.stats.retrieve('GRAPH COUNTS') YIELD data RETURN data"
+
+# Último recurso: un conteo por etiqueta
+CONSULTA_ESTADISTICAS_CONTEO = """
+    RETURN 
+        COUNT { MATCH (n) RETURN n } as total_nodos,
+        COUNT { MATCH (a:Alumno) RETURN a } as total_alumnos,
+        COUNT { MATCH (u:Unidad) RETURN u } as total_unidades,
+        COUNT { MATCH (r:RAP) RETURN r } as total_raps,
+        COUNT { MATCH (c:Cuestionario) RETURN c } as total_cuestionarios,
+        COUNT { MATCH (ay:Ayudantia) RETURN ay } as total_ayudantias,
+        COUNT { MATCH ()-[r]->() RETURN r } as total_relaciones
+"""
+
+
+def _estadisticas_desde_graph_counts(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Traduce el resultado de db.stats.retrieve('GRAPH COUNTS') al formato de estadísticas.
+    
+    En 'nodes', la entrada sin 'label' es el total de nodos; en 'relationships',
+    la entrada sin tipo ni etiquetas es el total de relaciones.
+    
+    Args:
+        data: Mapa 'data' retornado por el procedimiento
+        
+    Returns:
+        Dict[str, Any]: Mismas keys que CONSULTA_ESTADISTICAS_APOC
+    """
+    por_etiqueta: Dict[str, int] = {}
+    total_nodos = 0
+    for entrada in data.get("nodes", []):
+        if "label" in entrada:
+            por_etiqueta[entrada["label"]] = entrada["count"]
+        else:
+            total_nodos = entrada["count"]
+
+    total_relaciones = 0
+    for entrada in data.get("relationships", []):
+        if not ({"relationshipType", "startLabel", "endLabel"} & entrada.keys()):
+            total_relaciones = entrada["count"]
+            break
+
+    return {
+        "total_nodos": total_nodos,
+        "total_alumnos": por_etiqueta.get("Alumno", 0),
+        "total_unidades": por_etiqueta.get("Unidad", 0),
+        "total_raps": por_etiqueta.get("RAP", 0),
+        "total_cuestionarios": por_etiqueta.get("Cuestionario", 0),
+        "total_ayudantias": por_etiqueta.get("Ayudantia", 0),
+        "total_relaciones": total_relaciones,
+    }
+
+
 def obtener_estadisticas_bd(driver: Driver) -> Dict[str, Any]:
     """
     Obtiene estadísticas actuales de la base de datos Neo4J.
@@ -80,23 +240,36 @@ def obtener_estadisticas_bd(driver: Driver) -> Dict[str, Any]:
         >>> stats = obtener_estadisticas_bd(driver)
         >>> print(stats['total_alumnos'])
         150
+        
+    Note:
+        - Usa apoc.meta.stats() si el plugin APOC está instalado (lectura de
+          contadores, sin recorrer el grafo)
+        - Sin APOC usa db.stats.retrieve('GRAPH COUNTS'), también sin recorrer
+        - Si ninguno está disponible recurre a la consulta de conteo por etiquetas
     """
-    with driver.session() as session:
+    with driver.session(database=NEO4J_DATABASE) as session:
+        try:
+            # Conteos desde los metadatos del store: no recorre nodos ni relaciones
+            result = session.run(CONSULTA_ESTADISTICAS_APOC)
+            record = result.single()
+            if record:
+                return record.data()
+        except Exception as e:
+            print(f"⚠️ apoc.meta.stats no disponible, usando GRAPH COUNTS: {e}")
+
         try:
-            result = session.run("""
-                MATCH (n)
-                RETURN 
-                    COUNT(n) as total_nodos,
-                    COUNT { MATCH (a:Alumno) RETURN a } as total_alumnos,
-                    COUNT { MATCH (u:Unidad) RETURN u } as total_unidades,
-                    COUNT { MATCH (r:RAP) RETURN r } as total_raps,
-                    COUNT { MATCH (c:Cuestionario) RETURN c } as total_cuestionarios,
-                    COUNT { MATCH (ay:Ayudantia) RETURN ay } as total_ayudantias,
-                    COUNT { MATCH ()-[r]->() RETURN r } as total_relaciones
-            """)
+            result = session.run(CONSULTA_ESTADISTICAS_GRAPH_COUNTS)
             record = result.single()
             if record:
-                return dict(record)
+                return _estadisticas_desde_graph_counts(record["data"])
+        except Exception as e:
+            print(f"⚠️ GRAPH COUNTS no disponible, usando conteo por etiquetas: {e}")
+
+        try:
+            result = session.run(CONSULTA_ESTADISTICAS_CONTEO)
+            record = result.single()
+            if record:
+                return record.data()
             return {}
         except Exception as e:
             print(f"❌ Error obteniendo estadísticas: {e}")
@@ -150,9 +323,12 @@ def mostrar_estadisticas_finales(estadisticas_iniciales: Dict[str, Any],
         📁 Unidades: 10 (+10) [+inf%]
         ...
     """
-    print("\n" + "="*60)
-    print("📊 ESTADÍSTICAS FINALES DEL PROCESO")
-    print("="*60)
+    # El reporte se arma completo y se escribe con un solo print
+    lineas: List[str] = [
+        "\n" + "="*60,
+        "📊 ESTADÍSTICAS FINALES DEL PROCESO",
+        "="*60,
+    ]
     
     # Totales por tipo de entidad
     tipos = [
@@ -171,18 +347,18 @@ def mostrar_estadisticas_finales(estadisticas_iniciales: Dict[str, Any],
         
         if diferencia > 0:
             porcentaje = calcular_porcentaje(final, inicial)
-            print(f"{emoji} {nombre}: {final} (+{diferencia}) [{porcentaje}]")
+            lineas.append(f"{emoji} {nombre}: {final} (+{diferencia}) [{porcentaje}]")
         else:
-            print(f"{emoji} {nombre}: {final}")
+            lineas.append(f"{emoji} {nombre}: {final}")
     
     # Estadísticas generales
     total_nodos_inicial = estadisticas_iniciales.get('total_nodos', 0)
     total_nodos_final = estadisticas_finales.get('total_nodos', 0)
     total_nuevos_nodos = total_nodos_final - total_nodos_inicial
     
-    print(f"\n🎯 RESUMEN GENERAL:")
-    print(f"   • Nodos totales en BD: {total_nodos_final}")
-    print(f"   • Nuevos nodos insertados: {total_nuevos_nodos}")
+    lineas.append("\n🎯 RESUMEN GENERAL:")
+    lineas.append(f"   • Nodos totales en BD: {total_nodos_final}")
+    lineas.append(f"   • Nuevos nodos insertados: {total_nuevos_nodos}")
     
     # Calcular porcentaje de completitud por tipo de actividad
     if total_nodos_final > 0:
@@ -191,18 +367,32 @@ def mostrar_estadisticas_finales(estadisticas_iniciales: Dict[str, Any],
         ayudantias = estadisticas_finales.get('total_ayudantias', 0)
         total_actividades = raps + cuestionarios + ayudantias
         
-        print(f"\n📈 DISTRIBUCIÓN DE ACTIVIDADES:")
+        lineas.append("\n📈 DISTRIBUCIÓN DE ACTIVIDADES:")
         if total_actividades > 0:
-            print(f"   • RAPs: {raps} ({raps/total_actividades*100:.1f}%)")
-            print(f"   • Cuestionarios: {cuestionarios} ({cuestionarios/total_actividades*100:.1f}%)")
-            print(f"   • Ayudantías: {ayudantias} ({ayudantias/total_actividades*100:.1f}%)")
-            print(f"   • Total actividades: {total_actividades}")
+            lineas.append(f"   • RAPs: {raps} ({raps/total_actividades*100:.1f}%)")
+            lineas.append(f"   • Cuestionarios: {cuestionarios} ({cuestionarios/total_actividades*100:.1f}%)")
+            lineas.append(f"   • Ayudantías: {ayudantias} ({ayudantias/total_actividades*100:.1f}%)")
+            lineas.append(f"   • Total actividades: {total_actividades}")
+
+    print("\n".join(lineas))
 
 
 # ==========================
 # Función auxiliar para procesar alumnos
 # ==========================
 
+# pyarrow es una dependencia opcional (no se instala con requirements.txt).
+# Si está instalado, read_csv usa su parser C++ multihilo. Ese motor no
+# acepta usecols como función, así que las columnas se filtran tras leer.
+# Sin pyarrow se usa el parser C de pandas con usecols.
+if importlib.util.find_spec("pyarrow") is not None:
+    OPCIONES_LECTURA_ALUMNOS: Dict[str, Any] = {"engine": "pyarrow"}
+else:
+    OPCIONES_LECTURA_ALUMNOS = {
+        "engine": "c",
+        "usecols": lambda columna: columna in COLUMNAS_CSV_ALUMNOS,
+    }
+
 def procesar_alumnos_con_driver(driver: Driver, rutas_csv: List[Path]) -> int:
     """
     Procesa alumnos desde archivos CSV usando driver de Neo4J.
@@ -210,48 +400,88 @@ def procesar_alumnos_con_driver(driver: Driver, rutas_csv: List[Path]) -> int:
     Lee múltiples archivos CSV de alumnos y los inserta en la base de datos.
     Maneja errores individuales por archivo sin detener el proceso completo.
     
+    Los CSV válidos se concatenan en un solo DataFrame que se inserta con una
+    única transacción (insertar_alumno lo envía en lotes UNWIND). Un error de
+    lectura o un CSV sin las columnas requeridas solo omite ese archivo.
+    
     Args:
         driver: Driver de conexión a Neo4J
         rutas_csv: Lista de rutas a archivos CSV con datos de alumnos
         
     Returns:
-        int: Número total de alumnos procesados exitosamente
-        
-    Raises:
-        FileNotFoundError: Si algún archivo CSV no existe
-        Exception: Para errores durante la lectura o inserción de datos
+        int: Número de alumnos insertados según insertar_alumno (sin las
+             filas omitidas por validación), o 0 si la inserción falla
         
     Example:
         >>> rutas = [Path("alumnos1.csv"), Path("alumnos2.csv")]
         >>> total = procesar_alumnos_con_driver(driver, rutas)
-        📄 Procesando 50 alumnos desde: alumnos1.csv
-        ✅ 50 alumnos insertados desde: alumnos1.csv
+        📄 50 alumnos leídos desde: alumnos1.csv
+        📄 50 alumnos leídos desde: alumnos2.csv
+        ✅ 100 alumnos insertados desde 2 archivos
         >>> print(total)
         100
     """
-    total_alumnos = 0
-    for ruta in rutas_csv:
-        if not ruta.exists():
-            print(f"⚠️ Archivo no encontrado: {ruta}")
-            continue
-            
+    # Un solo stat por ruta; si no queda ningún archivo no se lee nada
+    presentes = [ruta for ruta in rutas_csv if ruta.is_file()]
+    faltantes_disco = set(rutas_csv).difference(presentes)
+    # Los avisos por archivo se acumulan y se muestran con un solo print
+    avisos: List[str] = [
+        f"⚠️ Archivo no encontrado: {ruta}" for ruta in rutas_csv if ruta in faltantes_disco
+    ]
+    if not presentes:
+        if avisos:
+            print("\n".join(avisos))
+        return 0
+
+    # pandas se importa aquí y no al cargar el módulo: el menú principal y
+    # mostrar_estadisticas_rapidas no lo necesitan
+    import pandas as pd
+
+    marcos: List[pd.DataFrame] = []
+    for ruta in presentes:
         try:
-            df: pd.DataFrame = pd.read_csv(ruta)  # type: ignore
-            # Contar alumnos en el CSV
-            alumnos_en_csv = len(df)
-            print(f"📄 Procesando {alumnos_en_csv} alumnos desde: {ruta.name}")
-            
-            # Usar driver directamente en lugar de session.execute_write
-            with driver.session() as session:
-                session.execute_write(insertar_alumno, df)
-            
-            total_alumnos += alumnos_en_csv
-            print(f"✅ {alumnos_en_csv} alumnos insertados desde: {ruta.name}")
-            
+            # Solo las columnas usadas, como texto: evita inferir tipos y
+            # construir columnas que la inserción descarta
+            df: pd.DataFrame = pd.read_csv(  # type: ignore
+                ruta,
+                dtype=str,
+                keep_default_na=False,  # celdas vacías como "" y no NaN
+                **OPCIONES_LECTURA_ALUMNOS,
+            )
+            df = df[[col for col in df.columns if col in COLUMNAS_CSV_ALUMNOS]]
         except Exception as e:
-            print(f"❌ Error procesando alumnos desde {ruta}: {e}")
-    
-    return total_alumnos
+            avisos.append(f"❌ Error procesando alumnos desde {ruta}: {e}")
+            continue
+
+        faltantes = [col for col in COLUMNAS_REQUERIDAS_ALUMNOS if col not in df.columns]
+        if faltantes:
+            avisos.append(f"❌ Error procesando alumnos desde {ruta}: faltan columnas {faltantes}")
+            continue
+
+        avisos.append(f"📄 {len(df)} alumnos leídos desde: {ruta.name}")
+        marcos.append(df)
+
+    if avisos:
+        print("\n".join(avisos))
+
+    if not marcos:
+        return 0
+
+    # Un solo DataFrame y una sola transacción para todos los archivos: la
+    # sesión, el plan de la consulta y el commit se pagan una vez
+    alumnos = pd.concat(marcos, ignore_index=True)
+    try:
+        with driver.session(database=NEO4J_DATABASE) as sesion:
+            insertados, errores = sesion.execute_write(insertar_alumno, alumnos)
+    except Exception as e:
+        print(f"❌ Error insertando alumnos: {e}")
+        return 0
+
+    resumen = f"✅ {insertados} alumnos insertados desde {len(marcos)} archivos"
+    if errores:
+        resumen += f" ({errores} filas omitidas)"
+    print(resumen)
+    return insertados
 
 
 # ==========================
@@ -276,13 +506,43 @@ def limpiar_bd_con_driver(driver: Driver) -> None:
         🧹 Base de datos limpiada correctamente.
     """
     try:
-        with driver.session() as session:
-            session.execute_write(limpiar_bd)
+        with driver.session(database=NEO4J_DATABASE) as session:
+            limpiar_bd(session)
         print("🧹 Base de datos limpiada correctamente.")
     except Exception as e:
         print(f"❌ Error limpiando la base de datos: {e}")
 
 
+def crear_restricciones_con_driver(driver: Driver) -> bool:
+    """
+    Crea las restricciones de unicidad (e índices asociados) y los índices del grafo.
+    
+    Debe ejecutarse antes de las fases de inserción para que todos los MERGE
+    posteriores sobre Alumno, Unidad, RAP, Cuestionario y Ayudantia usen índice.
+    Es idempotente gracias a IF NOT EXISTS.
+    
+    Args:
+        driver: Driver de conexión a Neo4J
+        
+    Returns:
+        bool: True si las restricciones quedaron verificadas. Sin ellas, dos
+              MERGE concurrentes del mismo nodo pueden crear duplicados, por lo
+              que las fases de inserción no deben ejecutarse en paralelo
+        
+    Example:
+        >>> crear_restricciones_con_driver(driver)
+        🔑 Restricciones de esquema verificadas (6).
+        True
+    """
+    try:
+        crear_restricciones_esquema(driver)
+        print(f"🔑 Restricciones de esquema verificadas ({len(RESTRICCIONES_ESQUEMA)}).")
+        return True
+    except Exception as e:
+        print(f"⚠️ No se pudieron crear las restricciones de esquema: {e}")
+        return False
+
+
 # ==========================
 # Función principal
 # ==========================
@@ -400,8 +660,11 @@ def rellenarGrafo() -> None:
         🎉 ¡PROCESO COMPLETADO EXITOSAMENTE!
     """
     driver: Driver = obtener_driver()
+    estado_logging: Optional[EstadoLoggingCola] = None
 
     try:
+        estado_logging = iniciar_logging_en_cola()
+
         # --------------------------
         # FASE 1: ESTADÍSTICAS INICIALES
         # --------------------------
@@ -413,31 +676,40 @@ def rellenarGrafo() -> None:
         # --------------------------
         print("\n🧹 LIMPIANDO BASE DE DATOS...")
         limpiar_bd_con_driver(driver)
+        restricciones_ok = crear_restricciones_con_driver(driver)
 
         # --------------------------
-        # FASE 3: INSERCIÓN DE ALUMNOS (AUTOMÁTICA)
+        # FASES 3-5: INSERCIÓN DE ALUMNOS, UNIDADES/RAPS Y ACTIVIDADES (EN PARALELO)
         # --------------------------
+        # Las tres fases escriben nodos independientes; los MERGE compartidos
+        # sobre Unidad solo son seguros en paralelo con la restricción de
+        # unicidad. Si no se pudo verificar, las fases se ejecutan en secuencia
+        # (un solo hilo, en el orden en que se envían).
+        # El driver es thread-safe y cada fase abre sus propias sesiones.
         print("\n👥 DETECTANDO E INSERTANDO ALUMNOS...")
         rutas_alumnos = obtener_archivos_alumnos(BASE_PATH)
         
         if not rutas_alumnos:
             print("❌ No se encontraron archivos de alumnos")
             return
-            
-        total_alumnos_procesados = procesar_alumnos_con_driver(driver, rutas_alumnos)
-        print(f"✅ Total alumnos procesados: {total_alumnos_procesados}")
-
-        # --------------------------
-        # FASE 4: INSERCIÓN DE UNIDADES Y MATERIALES
-        # --------------------------
-        print("\n📚 INSERTANDO UNIDADES Y RAPS...")
-        procesar_unidades_y_raps(driver, BASE_PATH)
 
-        # --------------------------
-        # FASE 5: INSERCIÓN DE ACTIVIDADES
-        # --------------------------
-        print("\n📝 INSERTANDO CUESTIONARIOS Y AYUDANTÍAS...")
-        procesar_cuestionarios_y_ayudantias(driver, BASE_PATH)
+        print("📚 INSERTANDO UNIDADES Y RAPS...")
+        print("📝 INSERTANDO CUESTIONARIOS Y AYUDANTÍAS...")
+        if not restricciones_ok:
+            print("⚠️ Sin restricciones de unicidad: las fases de inserción se ejecutarán en secuencia")
+        with ThreadPoolExecutor(max_workers=3 if restricciones_ok else 1) as executor:
+            futuro_alumnos = executor.submit(procesar_alumnos_con_driver, driver, rutas_alumnos)
+            fases = {
+                futuro_alumnos: "Alumnos",
+                executor.submit(procesar_unidades_y_raps, driver, BASE_PATH): "Unidades y RAPs",
+                executor.submit(procesar_cuestionarios_y_ayudantias, driver, BASE_PATH): "Cuestionarios y ayudantías",
+            }
+            # Se informa cada fase al terminar; un error se propaga apenas ocurre
+            for futuro in as_completed(fases):
+                futuro.result()
+                print(f"✔️ Fase completada: {fases[futuro]}")
+
+        print(f"✅ Total alumnos procesados: {futuro_alumnos.result()}")
 
         # --------------------------
         # FASE 6: VALIDACIÓN DE RELACIONES DE MATERIAL
@@ -465,8 +737,9 @@ def rellenarGrafo() -> None:
         raise
     finally:
         # Cerrar el driver al finalizar
-        from Neo4J.conn import cerrar_driver
         cerrar_driver()
+        if estado_logging is not None:
+            detener_logging_en_cola(estado_logging)
 
 
 # ==========================
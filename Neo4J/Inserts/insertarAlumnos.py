@@ -8,8 +8,11 @@ para la entidad Alumno, con validación de datos y manejo robusto de errores.
 Funciones principales:
     - limpiar_bd: Limpieza completa de la base de datos
     - insertar_alumno: Inserción masiva de alumnos desde DataFrame
+    - extraer_paralelos: Extracción vectorizada del paralelo para una columna completa
+    - insertar_alumnos_batch: Inserción por lotes (UNWIND) de alumnos ya validados
     - contar_alumnos: Consulta del total de alumnos registrados
     - buscar_alumno_por_correo: Búsqueda específica por correo electrónico
+    - buscar_alumno_por_correo_normalizado: Búsqueda con un correo ya normalizado
 
 Características:
     - Validación exhaustiva de datos de entrada
@@ -21,7 +24,8 @@ Características:
 
 Estructura de datos esperada:
     - DataFrame con columnas: ['Nombre', 'Apellido(s)', 'Dirección de correo', 'Grupos']
-    - Correo electrónico como identificador único
+    - Correo electrónico como identificador único, guardado siempre en
+      minúsculas y sin espacios (ver normalizar_correo)
     - Columna 'Grupos' puede contener múltiples grupos separados por comas
 
 Cambios realizados:
@@ -31,20 +35,53 @@ Cambios realizados:
     - ✅ Actualizada documentación con nuevos ejemplos y comportamientos
 """
 
-from pandas import DataFrame
-from typing import Any, Dict
-from neo4j import ManagedTransaction
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+from neo4j import ManagedTransaction, Session, Transaction
+from neo4j.exceptions import ClientError
 import logging
 import re
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    # Solo para anotaciones: pandas se importa donde se leen los CSV
+    from pandas import DataFrame, Series
 
 # Configuración de logging para seguimiento de operaciones
 logger = logging.getLogger(__name__)
 
+# Cantidad de alumnos enviados por cada UNWIND en insertar_alumnos_batch
+TAMANO_LOTE_ALUMNOS = 1000
+
+# Nodos eliminados por cada sub-transacción de limpiar_bd
+TAMANO_LOTE_BORRADO = 10000
+
+# Patrones de paralelo, compilados una sola vez al cargar el módulo
+_ALUMNOS_PARALELO_RE = re.compile(r'alumnos_paralelo_?(\d+)', re.IGNORECASE)
+_PARALELO_RE = re.compile(r'paralelo[\s_]*(\d+)', re.IGNORECASE)
+_CEROS_IZQUIERDA_RE = re.compile(r'^0+(?=\d)')
+
+# Forma mínima de un correo: usuario@dominio.tld, sin espacios ni '@' extra
+_CORREO_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Columnas obligatorias del CSV de alumnos
+COLUMNAS_REQUERIDAS_ALUMNOS = ('Nombre', 'Apellido(s)', 'Dirección de correo')
+
+# Columnas del CSV de alumnos que usa la inserción; el resto no se lee
+COLUMNAS_CSV_ALUMNOS = COLUMNAS_REQUERIDAS_ALUMNOS + ('Grupos',)
+
+# Consultas de lectura de alumnos
+CONSULTA_CONTAR_ALUMNOS = "MATCH (a:Alumno) RETURN count(a) as total"
+CONSULTA_BUSCAR_ALUMNO = (
+    "MATCH (a:Alumno {correo: $correo}) "
+    "RETURN a.nombre as nombre, a.correo as correo, a.paralelo as paralelo"
+)
+
 
 # ==========================
 # Funciones de utilidad para procesamiento de datos
 # ==========================
 
+@lru_cache(maxsize=1024)
 def extraer_paralelo(grupos_str: str) -> str:
     """
     Extrae el paralelo de la columna Grupos del CSV.
@@ -54,6 +91,9 @@ def extraer_paralelo(grupos_str: str) -> str:
     - "Paralelo_1", "Paralelo_2", etc.
     - "Paralelo 1", "Paralelo 2", etc.
     
+    Los resultados se memorizan (lru_cache): los valores de 'Grupos' se repiten
+    mucho entre alumnos del mismo paralelo.
+    
     Args:
         grupos_str: String con grupos/paralelos
         
@@ -74,7 +114,7 @@ def extraer_paralelo(grupos_str: str) -> str:
             return "Sin_paralelo"
             
         # Patrón para "Alumnos_Paralelo_01", "Alumnos_Paralelo_02", etc.
-        match_alumnos = re.search(r'alumnos_paralelo_?(\d+)', grupos_clean, re.IGNORECASE)
+        match_alumnos = _ALUMNOS_PARALELO_RE.search(grupos_clean)
         if match_alumnos:
             numero = match_alumnos.group(1)
             # Remover ceros a la izquierda: "01" -> "1", "10" -> "10"
@@ -82,7 +122,7 @@ def extraer_paralelo(grupos_str: str) -> str:
             return f"Paralelo_{numero_sin_ceros}"
             
         # Patrón original para "Paralelo_X", "Paralelo X"
-        match_paralelo = re.search(r'paralelo[\s_]*(\d+)', grupos_clean, re.IGNORECASE)
+        match_paralelo = _PARALELO_RE.search(grupos_clean)
         if match_paralelo:
             numero = match_paralelo.group(1)
             numero_sin_ceros = str(int(numero))  # Normalizar "01" a "1"
@@ -90,38 +130,81 @@ def extraer_paralelo(grupos_str: str) -> str:
             
         return "Sin_paralelo"
     except Exception as e:
-        logger.debug(f"Error extrayendo paralelo de '{grupos_str}': {e}")
+        logger.debug("Error extrayendo paralelo de '%s': %s", grupos_str, e)
         return "Sin_paralelo"
 
 
-def limpiar_y_validar_dato(dato: Any) -> str:
+def extraer_paralelos(grupos: "Series") -> "Series":
+    """
+    Versión vectorizada de extraer_paralelo para una columna completa.
+    
+    Aplica los mismos patrones y la misma prioridad que extraer_paralelo
+    ("Alumnos_Paralelo_XX" antes que "Paralelo X"), pero con Series.str.extract,
+    que recorre la columna en C en lugar de llamar a una función por fila.
+    
+    Args:
+        grupos: Columna 'Grupos' como texto (sin nulos)
+        
+    Returns:
+        Series: Paralelo normalizado por fila ("Paralelo_3") o "Sin_paralelo"
+        
+    Example:
+        >>> extraer_paralelos(df['Grupos']).tolist()
+        ['Paralelo_3', 'Paralelo_1', 'Sin_paralelo']
     """
-    Limpia y valida un dato del DataFrame, manejando valores nulos.
+    # Un CSV repite pocos valores distintos de 'Grupos' (uno por paralelo):
+    # las expresiones se evalúan solo sobre los valores únicos
+    unicos = grupos.drop_duplicates()
+    numeros = unicos.str.extract(_ALUMNOS_PARALELO_RE, expand=False)
+    numeros = numeros.fillna(
+        unicos.str.extract(_PARALELO_RE, expand=False)
+    )
+    # Remover ceros a la izquierda: "01" -> "1", "10" -> "10", "00" -> "0"
+    numeros = numeros.str.replace(_CEROS_IZQUIERDA_RE, '', regex=True)
+    paralelo_por_valor = dict(zip(unicos, ("Paralelo_" + numeros).fillna("Sin_paralelo")))
+    return grupos.map(paralelo_por_valor)
+
+
+def normalizar_correo(correo: str) -> str:
+    """
+    Normaliza un correo al formato con que se guarda en los nodos Alumno.
+    
+    Invariante: a.correo se almacena siempre en minúsculas y sin espacios en
+    los extremos (insertar_alumno aplica lo mismo de forma vectorizada).
     
     Args:
-        dato: Valor a limpiar (puede ser string, número, NaN, etc.)
+        correo: Correo tal como viene de la entrada
         
     Returns:
-        str: Dato limpio como string, o string vacío si es nulo/inválido
+        str: Correo normalizado
+        
+    Example:
+        >>> normalizar_correo("  Juan.Perez@Email.com ")
+        'juan.perez@email.com'
     """
-    if dato is None:
-        return ""
-    return str(dato).strip()
+    return correo.strip().lower()
 
 
 # ==========================
 # Función: limpiar la BD
 # ==========================
 
-def limpiar_bd(tx: ManagedTransaction) -> None:
+def limpiar_bd(session: Session) -> None:
     """
     Elimina todos los nodos y relaciones de la base de datos Neo4J.
     
     Esta operación es destructiva y debe usarse con precaución. Está diseñada
     para limpiar completamente la base de datos antes de una nueva inserción masiva.
     
+    El borrado se hace en sub-transacciones de TAMANO_LOTE_BORRADO nodos
+    (CALL { ... } IN TRANSACTIONS), de modo que la memoria usada por el servidor
+    queda acotada aunque el grafo sea grande. Como IN TRANSACTIONS solo se
+    permite en transacciones implícitas, recibe la sesión y usa session.run.
+    En servidores sin IN TRANSACTIONS (anteriores a 4.4) borra por lotes con
+    LIMIT hasta que no queden nodos.
+    
     Args:
-        tx: Transacción activa de Neo4J para ejecutar la operación
+        session: Sesión activa de Neo4J (no una transacción administrada)
         
     Raises:
         Exception: Si la operación de limpieza falla por problemas de conexión
@@ -129,7 +212,7 @@ def limpiar_bd(tx: ManagedTransaction) -> None:
                    
     Example:
         >>> with driver.session() as session:
-        ...     session.execute_write(limpiar_bd)
+        ...     limpiar_bd(session)
         Base de datos limpiada: 150 nodos eliminados
         
     Note:
@@ -138,11 +221,31 @@ def limpiar_bd(tx: ManagedTransaction) -> None:
         - Útil para resetear el estado de la base de datos
     """
     try:
-        result = tx.run("MATCH (n) DETACH DELETE n")
-        summary = result.consume()
-        logger.info(f"Base de datos limpiada: {summary.counters.nodes_deleted} nodos eliminados")
+        try:
+            result = session.run(
+                f"""
+                MATCH (n)
+                CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {TAMANO_LOTE_BORRADO} ROWS
+                """
+            )
+            eliminados = result.consume().counters.nodes_deleted
+        except ClientError as e:
+            # Servidores anteriores a 4.4 no soportan IN TRANSACTIONS: se borra
+            # por lotes desde Python, un auto-commit por lote, hasta vaciar
+            logger.info("IN TRANSACTIONS no disponible, borrando por lotes: %s", e)
+            eliminados = 0
+            while True:
+                record = session.run(
+                    "MATCH (n) WITH n LIMIT $lote DETACH DELETE n RETURN count(*) AS borrados",
+                    lote=TAMANO_LOTE_BORRADO
+                ).single()
+                borrados: int = record["borrados"] if record else 0
+                if borrados == 0:
+                    break
+                eliminados += borrados
+        logger.info("Base de datos limpiada: %s nodos eliminados", eliminados)
     except Exception as e:
-        logger.error(f"Error limpiando la base de datos: {e}")
+        logger.error("Error limpiando la base de datos: %s", e)
         raise
 
 
@@ -150,7 +253,59 @@ def limpiar_bd(tx: ManagedTransaction) -> None:
 # Función: insertar alumnos
 # ==========================
 
-def insertar_alumno(tx: ManagedTransaction, alumnos: DataFrame) -> None:
+def insertar_alumnos_batch(tx: Union[ManagedTransaction, Transaction], filas: List[Dict[str, str]]) -> int:
+    """
+    Inserta una lista de alumnos ya validados usando UNWIND por lotes.
+    
+    Cada lote de TAMANO_LOTE_ALUMNOS filas se envía en una sola consulta, de modo
+    que la inserción cuesta un viaje a Neo4J por lote en lugar de uno por alumno.
+    MERGE sobre el correo mantiene la prevención de duplicados.
+    
+    Args:
+        tx: Transacción de Neo4J (administrada o explícita) para ejecutar las inserciones
+        filas: Diccionarios con las keys 'nombre', 'apellidos', 'correo' y 'paralelo'
+        
+    Returns:
+        int: Número de alumnos procesados (creados o actualizados)
+        
+    Raises:
+        Exception: Si falla algún lote; la transacción completa se revierte
+        
+    Example:
+        >>> filas = [{"nombre": "Juan", "apellidos": "Pérez",
+        ...           "correo": "juan@email.com", "paralelo": "Paralelo_3"}]
+        >>> with driver.session() as session:
+        ...     session.execute_write(insertar_alumnos_batch, filas)
+        1
+    """
+    procesados_total = 0
+    for inicio in range(0, len(filas), TAMANO_LOTE_ALUMNOS):
+        lote = filas[inicio:inicio + TAMANO_LOTE_ALUMNOS]
+        try:
+            result = tx.run(
+                """
+                UNWIND $filas AS fila
+                MERGE (a:Alumno {correo: fila.correo})
+                SET a.nombre = fila.nombre,
+                    a.apellidos = fila.apellidos,
+                    a.paralelo = fila.paralelo
+                """,
+                filas=lote,
+            )
+            # Sin RETURN: no se materializan registros, solo el resumen
+            contadores = result.consume().counters
+            procesados_total += len(lote)
+            logger.debug(
+                "Lote de alumnos procesado: %s filas, %s nuevos, %s propiedades",
+                len(lote), contadores.nodes_created, contadores.properties_set
+            )
+        except Exception as e:
+            logger.error("Error insertando lote de alumnos (%s-%s): %s", inicio, inicio + len(lote) - 1, e)
+            raise
+    return procesados_total
+
+
+def insertar_alumno(tx: Union[ManagedTransaction, Transaction], alumnos: "DataFrame") -> Tuple[int, int]:
     """
     Inserta alumnos en Neo4J a partir de un DataFrame de pandas.
     
@@ -167,7 +322,7 @@ def insertar_alumno(tx: ManagedTransaction, alumnos: DataFrame) -> None:
         6. 📊 Reporte de resultados
     
     Args:
-        tx: Transacción activa de Neo4J para ejecutar las inserciones
+        tx: Transacción de Neo4J (administrada o explícita) para ejecutar las inserciones
         alumnos: DataFrame con las columnas requeridas:
                 - 'Nombre': Nombre del alumno
                 - 'Apellido(s)': Apellidos del alumno  
@@ -179,7 +334,7 @@ def insertar_alumno(tx: ManagedTransaction, alumnos: DataFrame) -> None:
         KeyError: Si faltan columnas esenciales en el DataFrame
         
     Returns:
-        None: Los resultados se reportan vía logging
+        Tuple[int, int]: (alumnos insertados, filas omitidas por error)
         
     Example:
         >>> df = pd.DataFrame({
@@ -189,17 +344,19 @@ def insertar_alumno(tx: ManagedTransaction, alumnos: DataFrame) -> None:
         ...     'Grupos': ['Paralelo_3', 'Paralelo_1, grupo LAB']
         ... })
         >>> with driver.session() as session:
-        ...     session.execute_write(insertar_alumno, df)
-        Inserción de alumnos completada: 2 insertados, 0 errores
+        ...     insertados, errores = session.execute_write(insertar_alumno, df)
+        >>> print(insertados, errores)
+        2 0
         
     Note:
         - Los correos se convierten a minúsculas automáticamente
         - Se omiten filas con datos incompletos o inválidos
-        - El proceso continúa despite errores individuales
+        - Los alumnos válidos se insertan en lotes de TAMANO_LOTE_ALUMNOS
+          con UNWIND; un error de Neo4J en un lote aborta la transacción
         - La columna 'Grupos' es opcional pero recomendada
     """
     # Validar que el DataFrame tenga las columnas requeridas
-    required_columns = ['Nombre', 'Apellido(s)', 'Dirección de correo']
+    required_columns = list(COLUMNAS_REQUERIDAS_ALUMNOS)
     missing_columns = [col for col in required_columns if col not in alumnos.columns]
     
     if missing_columns:
@@ -209,84 +366,63 @@ def insertar_alumno(tx: ManagedTransaction, alumnos: DataFrame) -> None:
     
     if alumnos.empty:
         logger.warning("DataFrame de alumnos está vacío")
-        return
+        return 0, 0
 
     # Verificar si existe columna Grupos
     tiene_grupos = 'Grupos' in alumnos.columns
     if not tiene_grupos:
         logger.warning("Columna 'Grupos' no encontrada - Los alumnos se crearán sin paralelo")
 
-    alumnos_insertados = 0
-    errores = 0
+    # Limpieza vectorizada: operaciones .str sobre columnas completas en lugar
+    # de limpiar celda por celda; los nulos se tratan como texto vacío
+    columnas = required_columns + (['Grupos'] if tiene_grupos else [])
+    datos = alumnos[columnas].fillna("").astype(str)
+    nombres = datos['Nombre'].str.strip()
+    apellidos = datos['Apellido(s)'].str.strip()
+    correos = datos['Dirección de correo'].str.strip().str.lower()
+
+    # Validar correo electrónico y que tengamos nombre y apellidos
+    # (una sola pasada de la expresión regular sobre toda la columna)
+    correo_invalido = ~correos.str.match(_CORREO_RE)
+    incompletos = ~correo_invalido & ((nombres == "") | (apellidos == ""))
+    if correo_invalido.any():
+        logger.warning("Filas %s: Correo vacío o inválido, omitiendo", list(datos.index[correo_invalido]))
+    if incompletos.any():
+        logger.warning("Filas %s: Datos incompletos, omitiendo", list(datos.index[incompletos]))
+
+    validos = ~(correo_invalido | incompletos)
+    errores = int((~validos).sum())
+
+    # Extraer paralelo si existe la columna Grupos
     alumnos_sin_paralelo = 0
-
-    for index, row in alumnos.iterrows():
-        try:
-            # Validar y limpiar datos usando función helper
-            nombre: str = limpiar_y_validar_dato(row['Nombre'])
-            apellidos: str = limpiar_y_validar_dato(row['Apellido(s)'])
-            correo_raw = row['Dirección de correo']
-            
-            # Validar correo electrónico
-            if correo_raw is None or not str(correo_raw).strip():
-                logger.warning(f"Fila {index}: Correo vacío o inválido, omitiendo")
-                errores += 1
-                continue
-                
-            correo: str = str(correo_raw).strip().lower()
-            
-            # Validar que tengamos nombre y correo
-            if not nombre or not apellidos or not correo:
-                logger.warning(f"Fila {index}: Datos incompletos, omitiendo")
-                errores += 1
-                continue
-
-            # Extraer paralelo si existe la columna Grupos
-            paralelo: str = "Sin_paralelo"
-            if tiene_grupos:
-                grupos_raw = row['Grupos']
-                paralelo = extraer_paralelo(grupos_raw)
-                if paralelo == "Sin_paralelo":
-                    alumnos_sin_paralelo += 1
-
-            # Usar MERGE en lugar de CREATE para evitar duplicados
-            # Ahora incluye la propiedad paralelo
-            result = tx.run(
-                """
-                MERGE (a:Alumno {correo: $correo})
-                SET a.nombre = $nombre,
-                    a.apellidos = $apellidos,
-                    a.paralelo = $paralelo
-                RETURN a.correo as correo, a.paralelo as paralelo
-                """,
-                {
-                    "nombre": nombre,
-                    "apellidos": apellidos,
-                    "correo": correo,
-                    "paralelo": paralelo
-                },
-            )
-            
-            record = result.single()
-            if record:
-                correo_insertado: str = record["correo"]
-                paralelo_asignado: str = record["paralelo"]
-                logger.debug(f"Alumno procesado: {correo_insertado} -> {paralelo_asignado}")
-                alumnos_insertados += 1
-            else:
-                logger.warning(f"Fila {index}: No se pudo verificar la inserción del alumno")
-                errores += 1
-
-        except Exception as e:
-            logger.error(f"Error insertando alumno en fila {index}: {e}")
-            errores += 1
-            # Continuar con el siguiente alumno en lugar de fallar completamente
-            continue
+    paralelos: Any = "Sin_paralelo"
+    if tiene_grupos:
+        paralelos = extraer_paralelos(datos.loc[validos, 'Grupos'])
+        alumnos_sin_paralelo = int((paralelos == "Sin_paralelo").sum())
+
+    validados = datos.loc[validos, []].assign(
+        nombre=nombres[validos],
+        apellidos=apellidos[validos],
+        correo=correos[validos],
+        paralelo=paralelos,
+    )
+
+    # Un mismo correo puede venir repetido (p. ej. en varios CSV concatenados);
+    # se envía una vez, conservando la última aparición como hacía MERGE + SET
+    duplicados = validados.duplicated("correo", keep="last")
+    if duplicados.any():
+        logger.info("%s filas con correo repetido, se conserva la última", int(duplicados.sum()))
+    filas: List[Dict[str, str]] = validados[~duplicados].to_dict("records")
+
+    alumnos_insertados = insertar_alumnos_batch(tx, filas)
+    errores += len(filas) - alumnos_insertados
 
     # Reporte final detallado
-    logger.info(f"Inserción de alumnos completada: {alumnos_insertados} insertados, {errores} errores")
+    logger.info("Inserción de alumnos completada: %s insertados, %s errores", alumnos_insertados, errores)
     if tiene_grupos and alumnos_sin_paralelo > 0:
-        logger.info(f"{alumnos_sin_paralelo} alumnos fueron asignados a 'Sin_paralelo'")
+        logger.info("%s alumnos fueron asignados a 'Sin_paralelo'", alumnos_sin_paralelo)
+
+    return alumnos_insertados, errores
 
 
 # ==========================
@@ -318,14 +454,14 @@ def contar_alumnos(tx: ManagedTransaction) -> int:
         - Retorna 0 en caso de error (fail-safe)
     """
     try:
-        result = tx.run("MATCH (a:Alumno) RETURN count(a) as total")
+        result = tx.run(CONSULTA_CONTAR_ALUMNOS)
         record = result.single()
         if record:
             total: int = record["total"]
             return total
         return 0
     except Exception as e:
-        logger.error(f"Error contando alumnos: {e}")
+        logger.error("Error contando alumnos: %s", e)
         return 0
 
 
@@ -353,7 +489,7 @@ def buscar_alumno_por_correo(tx: ManagedTransaction, correo: str) -> Dict[str, A
     Example:
         >>> with driver.session() as session:
         ...     alumno = session.execute_read(
-        ...         buscar_alumno_por_correo, "juan@email.com"
+        ...         buscar_alumno_por_correo, "Juan@Email.com "
         ...     )
         >>> if alumno:
         ...     print(f"Encontrado: {alumno['nombre']} - {alumno['paralelo']}")
@@ -364,12 +500,29 @@ def buscar_alumno_por_correo(tx: ManagedTransaction, correo: str) -> Dict[str, A
         - Retorna dict vacío para alumnos no encontrados
         - Búsqueda case-insensitive
         - Incluye información de paralelo si está disponible
+        - Si el correo ya viene normalizado (p. ej. leído desde Neo4J), usar
+          buscar_alumno_por_correo_normalizado
+    """
+    return buscar_alumno_por_correo_normalizado(tx, normalizar_correo(correo))
+
+
+def buscar_alumno_por_correo_normalizado(tx: ManagedTransaction, correo: str) -> Dict[str, Any]:
+    """
+    Busca un alumno por un correo que ya cumple el invariante de almacenamiento.
+    
+    No vuelve a normalizar: `correo` debe venir de normalizar_correo() o de un
+    nodo Alumno. Un correo con otra capitalización no coincide con la
+    restricción de unicidad y la búsqueda retorna vacío.
+    
+    Args:
+        tx: Transacción activa de Neo4J para ejecutar la búsqueda
+        correo: Correo en minúsculas y sin espacios en los extremos
+        
+    Returns:
+        Dict[str, Any]: Igual que buscar_alumno_por_correo
     """
     try:
-        result = tx.run(
-            "MATCH (a:Alumno {correo: $correo}) RETURN a.nombre as nombre, a.correo as correo, a.paralelo as paralelo",
-            correo=correo.lower().strip()
-        )
+        result = tx.run(CONSULTA_BUSCAR_ALUMNO, correo=correo)
         record = result.single()
         if record:
             return {
@@ -379,7 +532,7 @@ def buscar_alumno_por_correo(tx: ManagedTransaction, correo: str) -> Dict[str, A
             }
         return {}
     except Exception as e:
-        logger.error(f"Error buscando alumno {correo}: {e}")
+        logger.error("Error buscando alumno %s: %s", correo, e)
         return {}
 
 
@@ -424,9 +577,9 @@ def contar_alumnos_por_paralelo(tx: ManagedTransaction) -> Dict[str, int]:
             total: int = record["total"]
             distribucion[paralelo] = total
             
-        logger.info(f"Distribución de alumnos por paralelo: {distribucion}")
+        logger.info("Distribución de alumnos por paralelo: %s", distribucion)
         return distribucion
         
     except Exception as e:
-        logger.error(f"Error contando alumnos por paralelo: {e}")
+        logger.error("Error contando alumnos por paralelo: %s", e)
         return {}
\ No newline at end of file
@@ -7,8 +7,11 @@ relaciona con sus unidades correspondientes en la estructura curricular.
 
 Funciones principales:
     - procesar_cuestionarios_y_ayudantias: Proceso principal de inserción masiva
-    - insertar_cuestionario: Inserción individual de cuestionarios
-    - insertar_ayudantia: Inserción individual de ayudantías
+    - procesar_unidad: Inserción de las actividades de una unidad (un hilo por unidad)
+    - inventariar_actividades: Recorrido único de las carpetas de actividades
+    - asignar_actividades: Reparto de cada actividad a una sola unidad
+    - insertar_archivos_actividad: Inserción de todas las actividades de un tipo
+      de una unidad en una sola consulta (UNWIND)
     - limpiar_nombre_archivo: Normalización de nombres de archivo
     - contar_cuestionarios_y_ayudantias: Verificación de datos insertados
 
@@ -34,28 +37,95 @@ Estructura de carpetas esperada:
     │       └── ayudantia_2.csv
 """
 
+import os
+import stat
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Union, Optional, Callable, Dict
-from neo4j import Driver, ManagedTransaction
+from typing import Union, Optional, Dict, List, Set, Tuple
+from neo4j import Driver
 import re
 import logging
+from functools import lru_cache
+
+from Neo4J.conn import NEO4J_DATABASE, crear_restricciones_esquema
 
 # Configuración de logging para seguimiento de operaciones
 logger = logging.getLogger(__name__)
 
-# Type alias para funciones de transacción que procesan archivos
-TransactionFunction = Callable[[ManagedTransaction, str, str, str], None]
+# Sufijo "-calificaciones" y espacios repetidos, compilados una sola vez
+_SUFIJO_CALIFICACIONES_RE = re.compile(r'[\s_-]*calificaciones[\s_-]*$', re.IGNORECASE)
+_ESPACIOS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=32)
+def _prefijo_curso_re(paralelo_objetivo: str) -> "re.Pattern[str]":
+    """Patrón del prefijo de curso para un paralelo, compilado una vez por paralelo."""
+    return re.compile(r'INF1211-1234-\(1S2025\)-' + re.escape(paralelo_objetivo) + r'_', re.IGNORECASE)
+
+
+# Código de paralelo (P01, p02, ...) en el nombre de un archivo de actividad
+_PARALELO_ARCHIVO_RE = re.compile(r'[Pp]0\d')
+
+# Unidades procesadas en paralelo (cada consulta toma su sesión del pool)
+MAX_HILOS_UNIDADES = 8
+
+# Archivos de actividades por unidad: unidad -> subcarpeta -> nombres de CSV
+InventarioActividades = Dict[str, Dict[str, List[str]]]
+
+# Actividades a insertar por unidad: unidad -> subcarpeta -> nombres limpios
+AsignacionActividades = Dict[str, Dict[str, List[str]]]
+
+# Inserción por lote: la Unidad se resuelve una vez por consulta, antes del
+# UNWIND, y no una vez por fila. Las actividades que ya existen en la base (de
+# una carga anterior) se omiten completas, sin crear la relación con la nueva
+# unidad. Dentro de una misma carga, las repetidas entre unidades ya vienen
+# resueltas por asignar_actividades, así que dos hilos nunca envían el mismo
+# nombre. Cada actividad nueva crea exactamente una relación, por lo que
+# relationships_created cuenta las actividades creadas (nodes_created
+# incluiría la Unidad si es nueva)
+CONSULTA_INSERTAR_CUESTIONARIOS = """
+    MERGE (u:Unidad {nombre: $unidad})
+    WITH u
+    UNWIND $nombres AS nombre
+    OPTIONAL MATCH (existente:Cuestionario {nombre: nombre})
+    WITH u, nombre WHERE existente IS NULL
+    MERGE (c:Cuestionario {nombre: nombre})
+    MERGE (u)-[:TIENE_CUESTIONARIO]->(c)
+"""
+
+CONSULTA_INSERTAR_AYUDANTIAS = """
+    MERGE (u:Unidad {nombre: $unidad})
+    WITH u
+    UNWIND $nombres AS nombre
+    OPTIONAL MATCH (existente:Ayudantia {nombre: nombre})
+    WITH u, nombre WHERE existente IS NULL
+    MERGE (a:Ayudantia {nombre: nombre})
+    MERGE (u)-[:TIENE_AYUDANTIA]->(a)
+"""
+
+# Una consulta fija por etiqueta: cada una se planifica una vez y queda en la
+# caché de planes del servidor
+CONSULTAS_INSERTAR_ACTIVIDADES: Dict[str, str] = {
+    "Cuestionario": CONSULTA_INSERTAR_CUESTIONARIOS,
+    "Ayudantia": CONSULTA_INSERTAR_AYUDANTIAS,
+}
 
 
 # ==========================
 # Función: limpiar nombre de archivo
 # ==========================
 
+@lru_cache(maxsize=1024)
 def limpiar_nombre_archivo(nombre_archivo: str, paralelo_objetivo: str) -> Optional[str]:
     """
     Limpia el nombre del archivo y FILTRA solo el paralelo objetivo.
     Retorna None si no es del paralelo que nos interesa.
     
+    Es una función pura de sus dos argumentos, por lo que se memoriza: los
+    nombres repetidos entre unidades o entre cargas no vuelven a pasar por
+    las expresiones regulares.
+    
     Args:
         nombre_archivo: Nombre original del archivo a procesar
         paralelo_objetivo: Paralelo específico a filtrar (ej: 'P01')
@@ -67,37 +137,160 @@ def limpiar_nombre_archivo(nombre_archivo: str, paralelo_objetivo: str) -> Optio
         >>> limpiar_nombre_archivo("INF1211-1234-(1S2025)-P01_Cuestionario1-calificaciones.csv", "P01")
         'Cuestionario1'
     """
-    try:
-        nombre_raw = Path(nombre_archivo).stem
-        
-        # ✅ FILTRAR: Solo procesar archivos del paralelo objetivo
-        if paralelo_objetivo.upper() not in nombre_raw.upper():
-            return None  # No procesar
+    # ✅ FILTRAR: Solo procesar archivos del paralelo objetivo. Se comprueba
+    # sobre el nombre tal cual, antes de cualquier otra operación: la mayoría
+    # de los archivos son de otros paralelos y se descartan aquí. El paralelo
+    # suele llegar ya en mayúsculas (encontrar_paralelo_completo), y entonces
+    # basta una búsqueda directa sin pasar el nombre a mayúsculas
+    if paralelo_objetivo not in nombre_archivo and paralelo_objetivo.upper() not in nombre_archivo.upper():
+        return None  # No procesar
+    
+    # Nombre sin extensión (como Path.stem, sin construir un Path)
+    punto = nombre_archivo.rfind('.')
+    nombre_raw = nombre_archivo[:punto] if punto > 0 else nombre_archivo
+    
+    # ✅ LIMPIAR: Remover información de paralelo y código del curso
+    nombre_sin_prefijo = _prefijo_curso_re(paralelo_objetivo).sub('', nombre_raw)
+    
+    # ✅ ELIMINAR SUFIJO "-calificaciones"
+    nombre_sin_sufijo = _SUFIJO_CALIFICACIONES_RE.sub('', nombre_sin_prefijo)
+    
+    # ✅ LIMPIEZA FINAL
+    return _ESPACIOS_RE.sub(' ', nombre_sin_sufijo).strip()
+
+
+def listar_csv(carpeta: Union[str, Path]) -> Optional[List[str]]:
+    """
+    Lista, ordenados, los nombres de los archivos .csv de una carpeta.
+    
+    Usa una sola lectura con os.scandir, sin Path ni stat() por archivo, y
+    sin un exists() previo: la ausencia de la carpeta se detecta al leerla.
+    
+    Args:
+        carpeta: Ruta de la carpeta
         
-        # ✅ LIMPIAR: Remover información de paralelo y código del curso
-        patron_inicio = r'INF1211-1234-\(1S2025\)-' + re.escape(paralelo_objetivo) + r'_'
-        nombre_sin_prefijo = re.sub(patron_inicio, '', nombre_raw, flags=re.IGNORECASE)
+    Returns:
+        Optional[List[str]]: Nombres de archivo, o None si la carpeta no existe
+    """
+    try:
+        with os.scandir(carpeta) as entradas:
+            return sorted(
+                e.name for e in entradas
+                if e.name.lower().endswith(".csv") and e.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def inventariar_actividades(base_path: Path) -> InventarioActividades:
+    """
+    Recorre una sola vez las carpetas de unidad y sus CSV de actividades.
+    
+    El resultado lo usan tanto encontrar_paralelo_completo (conteo por
+    paralelo) como asignar_actividades (inserción), de modo que el árbol de
+    carpetas se lee una vez por carga y no una vez por cada fase.
+    
+    Args:
+        base_path: Ruta base donde se encuentran las carpetas de unidades
         
-        # ✅ ELIMINAR SUFIJO "-calificaciones"
-        patron_final = r'[\s_-]*calificaciones[\s_-]*$'
-        nombre_sin_sufijo = re.sub(patron_final, '', nombre_sin_prefijo, flags=re.IGNORECASE)
+    Returns:
+        InventarioActividades: unidad -> subcarpeta ('Cuestionarios',
+                               'Ayudantías') -> nombres de CSV. Las
+                               subcarpetas inexistentes no aparecen.
+    """
+    inventario: InventarioActividades = {}
+    for carpeta_unidad in encontrar_carpeta_unidades(base_path):
+        archivos_unidad: Dict[str, List[str]] = {}
+        for subcarpeta, _ in TIPOS_ACTIVIDAD.values():
+            archivos = listar_csv(carpeta_unidad / subcarpeta)
+            if archivos is not None:
+                archivos_unidad[subcarpeta] = archivos
+        inventario[carpeta_unidad.name] = archivos_unidad
+    return inventario
+
+
+def asignar_actividades(inventario: InventarioActividades, paralelo_objetivo: str) -> AsignacionActividades:
+    """
+    Limpia los nombres del paralelo objetivo y asigna cada actividad a una sola unidad.
+    
+    Las unidades se insertan en hilos concurrentes, y la comprobación de
+    "actividad ya existente" de la consulta no ve lo que otro hilo aún no
+    confirma. Por eso los nombres repetidos entre unidades se resuelven aquí,
+    antes de lanzar los hilos: cada actividad queda en la primera unidad en
+    orden alfabético, igual que con una carga secuencial.
+    
+    Args:
+        inventario: Resultado de inventariar_actividades()
+        paralelo_objetivo: Paralelo específico a procesar
         
-        # ✅ LIMPIEZA FINAL
-        nombre_limpio = nombre_sin_sufijo.strip()
-        nombre_limpio = re.sub(r'\s+', ' ', nombre_limpio).strip()
+    Returns:
+        AsignacionActividades: unidad -> subcarpeta -> nombres limpios, sin
+                               repetir dentro del tipo de actividad. Las
+                               subcarpetas inexistentes no aparecen.
+                               
+    Example:
+        >>> asignar_actividades({"Unidad_01": {"Cuestionarios": ["INF1211-1234-(1S2025)-P01_C1.csv"]},
+        ...                      "Unidad_02": {"Cuestionarios": ["INF1211-1234-(1S2025)-P01_C1.csv"]}}, "P01")
+        {'Unidad_01': {'Cuestionarios': ['C1']}, 'Unidad_02': {'Cuestionarios': []}}
+    """
+    asignacion: AsignacionActividades = {}
+    asignados: Dict[str, Set[str]] = defaultdict(set)
+    for unidad_nombre in sorted(inventario):
+        nombres_unidad: Dict[str, List[str]] = {}
+        for subcarpeta, archivos in inventario[unidad_nombre].items():
+            ya_asignados = asignados[subcarpeta]
+            nombres: List[str] = []
+            for nombre_archivo in archivos:
+                nombre_limpio = limpiar_nombre_archivo(nombre_archivo, paralelo_objetivo)
+                if nombre_limpio is None:
+                    continue
+                if nombre_limpio in ya_asignados:
+                    logger.debug("%s: '%s' ya pertenece a otra unidad - Saltando", unidad_nombre, nombre_limpio)
+                    continue
+                ya_asignados.add(nombre_limpio)
+                nombres.append(nombre_limpio)
+            nombres_unidad[subcarpeta] = nombres
+        asignacion[unidad_nombre] = nombres_unidad
+    return asignacion
+
+
+def paralelo_de_archivo(nombre: str) -> Optional[str]:
+    """
+    Extrae el código de paralelo ('P01', 'P02', ...) del nombre de un archivo.
+    
+    Los archivos exportados tienen el paralelo tras un guion
+    (INF1211-1234-(1S2025)-P01_...), así que primero se busca "-P0" con
+    str.find sobre el nombre tal cual, sin pasarlo a mayúsculas ni usar el
+    motor de expresiones regulares. Solo si eso falla (p. ej. "-p01") se
+    recurre a _PARALELO_ARCHIVO_RE.
+    
+    Args:
+        nombre: Nombre del archivo (con o sin extensión)
         
-        return nombre_limpio
+    Returns:
+        Optional[str]: Código en mayúsculas, o None si no contiene paralelo
         
-    except Exception as e:
-        logger.error(f"Error limpiando nombre de archivo '{nombre_archivo}': {e}")
-        return None
+    Example:
+        >>> paralelo_de_archivo("INF1211-1234-(1S2025)-P01_Cuestionario1-calificaciones")
+        'P01'
+    """
+    indice = nombre.find("-P0")
+    if indice != -1 and nombre[indice + 3:indice + 4].isdigit():
+        return nombre[indice + 1:indice + 4]
+    match = _PARALELO_ARCHIVO_RE.search(nombre)
+    return match.group(0).upper() if match else None
 
 
 # ==========================
 # Función: Contar Cuestionarios y Ayudantias para ver que paralelo tiene todos los archivos
 # ==========================
 
-def encontrar_paralelo_completo(base_path: Path, cuestionarios_esperados: int = 33, ayudantias_esperadas: int = 14) -> Optional[str]:
+def encontrar_paralelo_completo(
+    base_path: Path,
+    cuestionarios_esperados: int = 33,
+    ayudantias_esperadas: int = 14,
+    inventario: Optional[InventarioActividades] = None
+) -> Optional[str]:
     """
     Encuentra qué paralelo tiene la cantidad exacta de actividades esperadas.
     
@@ -108,6 +301,8 @@ def encontrar_paralelo_completo(base_path: Path, cuestionarios_esperados: int =
         base_path: Ruta base donde buscar las unidades
         cuestionarios_esperados: Número esperado de cuestionarios por paralelo
         ayudantias_esperadas: Número esperado de ayudantías por paralelo
+        inventario: Resultado de inventariar_actividades(base_path) para no
+                    volver a recorrer las carpetas. Si es None se calcula aquí
         
     Returns:
         Optional[str]: Nombre del paralelo completo o None si no se encuentra
@@ -119,36 +314,20 @@ def encontrar_paralelo_completo(base_path: Path, cuestionarios_esperados: int =
     """
     print(f"Buscando paralelo con {cuestionarios_esperados} cuestionarios y {ayudantias_esperadas} ayudantías...")
     
-    conteo_por_paralelo: Dict[str, Dict[str, int]] = {}
+    conteo_por_paralelo: Dict[str, Counter] = defaultdict(Counter)
     
-    # Escanear todos los archivos
-    for unidad_path in base_path.glob("Unidad*"):
-        if not unidad_path.is_dir():
-            continue
-            
-        # Contar cuestionarios por paralelo
-        cuestionarios_dir = unidad_path / "Cuestionarios"
-        if cuestionarios_dir.exists():
-            for archivo in cuestionarios_dir.glob("*.csv"):
-                nombre = archivo.stem
-                match = re.search(r'([Pp]0\d)', nombre)
-                if match:
-                    paralelo = match.group(1).upper()
-                    if paralelo not in conteo_por_paralelo:
-                        conteo_por_paralelo[paralelo] = {'cuestionarios': 0, 'ayudantias': 0}
-                    conteo_por_paralelo[paralelo]['cuestionarios'] += 1
-        
-        # Contar ayudantías por paralelo
-        ayudantias_dir = unidad_path / "Ayudantías"
-        if ayudantias_dir.exists():
-            for archivo in ayudantias_dir.glob("*.csv"):
-                nombre = archivo.stem
-                match = re.search(r'([Pp]0\d)', nombre)
-                if match:
-                    paralelo = match.group(1).upper()
-                    if paralelo not in conteo_por_paralelo:
-                        conteo_por_paralelo[paralelo] = {'cuestionarios': 0, 'ayudantias': 0}
-                    conteo_por_paralelo[paralelo]['ayudantias'] += 1
+    if inventario is None:
+        inventario = inventariar_actividades(base_path)
+
+    # Contar por paralelo sobre el inventario, sin volver a leer las carpetas
+    claves_conteo = {"Cuestionarios": "cuestionarios", "Ayudantías": "ayudantias"}
+    for archivos_unidad in inventario.values():
+        for subcarpeta, archivos in archivos_unidad.items():
+            clave = claves_conteo[subcarpeta]
+            for nombre_archivo in archivos:
+                paralelo = paralelo_de_archivo(nombre_archivo)
+                if paralelo:
+                    conteo_por_paralelo[paralelo][clave] += 1
     
     # Mostrar resultados
     print("CONTEOS POR PARALELO:")
@@ -183,118 +362,12 @@ def encontrar_paralelo_completo(base_path: Path, cuestionarios_esperados: int =
             return None
 
 
-# ==========================
-# Función: insertar un Cuestionario
-# ==========================
-
-def insertar_cuestionario(tx: ManagedTransaction, unidad: str, nombre_archivo: str, paralelo_objetivo: str) -> None:
-    """
-    Inserta cuestionario SOLO si es del paralelo objetivo.
-    
-    Crea un nodo Cuestionario en la base de datos y lo relaciona con su Unidad
-    correspondiente, filtrando únicamente los archivos del paralelo especificado.
-    
-    Args:
-        tx: Transacción de Neo4J
-        unidad: Nombre de la unidad a la que pertenece el cuestionario
-        nombre_archivo: Nombre del archivo CSV del cuestionario
-        paralelo_objetivo: Paralelo específico a procesar
-        
-    Example:
-        >>> insertar_cuestionario(tx, "Unidad_01", "cuestionario1.csv", "P01")
-    """
-    try:
-        nombre_limpio = limpiar_nombre_archivo(nombre_archivo, paralelo_objetivo)
-        
-        # Si retorna None, es porque no es del paralelo objetivo
-        if nombre_limpio is None:
-            return  # No procesar
-            
-        # Verificar si ya existe
-        result_check = tx.run(
-            "MATCH (c:Cuestionario {nombre: $nombre}) RETURN c",
-            nombre=nombre_limpio
-        )
-        
-        if result_check.single():
-            logger.debug(f"Cuestionario duplicado - Saltando: '{nombre_limpio}'")
-            return
-            
-        logger.info(f"Insertando cuestionario {paralelo_objetivo}: '{nombre_limpio}'")
-        
-        result = tx.run(
-            """
-            MERGE (u:Unidad {nombre: $unidad})
-            MERGE (c:Cuestionario {nombre: $nombre})
-            MERGE (u)-[:TIENE_CUESTIONARIO]->(c)
-            RETURN u.nombre as unidad, c.nombre as cuestionario
-            """,
-            unidad=unidad,
-            nombre=nombre_limpio,
-        )
-        
-        if result.single():
-            logger.debug(f"Cuestionario confirmado {paralelo_objetivo}: '{nombre_limpio}'")
-            
-    except Exception as e:
-        logger.error(f"Error insertando cuestionario: {e}")
-
-
-# ==========================
-# Función: insertar una Ayudantía
-# ==========================
-
-def insertar_ayudantia(tx: ManagedTransaction, unidad: str, nombre_archivo: str, paralelo_objetivo: str) -> None:
-    """
-    Inserta ayudantía SOLO si es del paralelo objetivo.
-    
-    Crea un nodo Ayudantia en la base de datos y lo relaciona con su Unidad
-    correspondiente, filtrando únicamente los archivos del paralelo especificado.
-    
-    Args:
-        tx: Transacción de Neo4J
-        unidad: Nombre de la unidad a la que pertenece la ayudantía
-        nombre_archivo: Nombre del archivo CSV de la ayudantía
-        paralelo_objetivo: Paralelo específico a procesar
-        
-    Example:
-        >>> insertar_ayudantia(tx, "Unidad_01", "ayudantia1.csv", "P01")
-    """
-    try:
-        nombre_limpio = limpiar_nombre_archivo(nombre_archivo, paralelo_objetivo)
-        
-        # Si retorna None, es porque no es del paralelo objetivo
-        if nombre_limpio is None:
-            return  # No procesar
-            
-        # Verificar si ya existe
-        result_check = tx.run(
-            "MATCH (a:Ayudantia {nombre: $nombre}) RETURN a",
-            nombre=nombre_limpio
-        )
-        
-        if result_check.single():
-            logger.debug(f"Ayudantía duplicada - Saltando: '{nombre_limpio}'")
-            return
-            
-        logger.info(f"Insertando ayudantía {paralelo_objetivo}: '{nombre_limpio}'")
-        
-        result = tx.run(
-            """
-            MERGE (u:Unidad {nombre: $unidad})
-            MERGE (a:Ayudantia {nombre: $nombre})
-            MERGE (u)-[:TIENE_AYUDANTIA]->(a)
-            RETURN u.nombre as unidad, a.nombre as ayudantia
-            """,
-            unidad=unidad,
-            nombre=nombre_limpio,
-        )
-        
-        if result.single():
-            logger.debug(f"Ayudantía confirmada {paralelo_objetivo}: '{nombre_limpio}'")
-            
-    except Exception as e:
-        logger.error(f"Error insertando ayudantía: {e}")
+# Tipos de actividad por unidad: nombre para logs -> (subcarpeta, etiqueta).
+# procesar_unidad recorre este registro en lugar de repetir cada llamada.
+TIPOS_ACTIVIDAD: Dict[str, Tuple[str, str]] = {
+    "cuestionario": ("Cuestionarios", "Cuestionario"),
+    "ayudantía": ("Ayudantías", "Ayudantia"),
+}
 
 
 # ==========================
@@ -325,53 +398,93 @@ def encontrar_carpeta_unidades(base_path: Path) -> list[Path]:
         - Retorna lista ordenada alfabéticamente
         - Ignora archivos y otros directorios
     """
-    return [
-        carpeta for carpeta in sorted(base_path.iterdir())
-        if carpeta.is_dir() 
-        and not carpeta.name.lower() == "alumnos"
-        and carpeta.name.lower().startswith("unidad")
-    ]
-
-
-def procesar_archivos_en_carpeta(
-    tx_funcion: TransactionFunction, 
-    driver: Driver, 
-    unidad_nombre: str, 
-    carpeta: Optional[Path], 
+    # os.scandir trae el tipo de cada entrada en la lectura del directorio:
+    # sin un stat() por hijo como iterdir() + is_dir()
+    with os.scandir(base_path) as entradas:
+        carpetas = [
+            Path(entrada.path) for entrada in entradas
+            if entrada.is_dir()
+            and not entrada.name.lower() == "alumnos"
+            and entrada.name.lower().startswith("unidad")
+        ]
+    return sorted(carpetas, key=lambda carpeta: carpeta.name)
+
+
+def insertar_archivos_actividad(
+    etiqueta: str,
+    driver: Driver,
+    unidad_nombre: str,
+    nombres: List[str],
     tipo_archivo: str,
     paralelo_objetivo: str
 ) -> int:
     """
-    Procesa archivos CSV en una carpeta específica usando el paralelo objetivo.
+    Inserta en un solo lote las actividades asignadas a una unidad.
     
     Args:
-        tx_funcion: Función de transacción a ejecutar (insertar_cuestionario o insertar_ayudantia)
-        driver: Driver de conexión a Neo4J
+        etiqueta: 'Cuestionario' o 'Ayudantia' (ver CONSULTAS_INSERTAR_ACTIVIDADES)
+        driver: Driver de conexión a Neo4J (thread-safe)
         unidad_nombre: Nombre de la unidad actual
-        carpeta: Path de la carpeta a procesar
+        nombres: Nombres limpios asignados a la unidad (ver asignar_actividades)
         tipo_archivo: Tipo de archivo para logging ('cuestionario' o 'ayudantía')
-        paralelo_objetivo: Paralelo específico a procesar
+        paralelo_objetivo: Paralelo específico a procesar (solo para logging)
         
     Returns:
-        int: Número de archivos procesados exitosamente
+        int: Número de actividades del paralelo objetivo procesadas exitosamente
     """
-    if not carpeta or not carpeta.exists() or not carpeta.is_dir():
-        logger.warning(f"Carpeta de {tipo_archivo} no encontrada en {unidad_nombre}")
+    if not nombres:
+        return 0
+
+    try:
+        _, resumen, _ = driver.execute_query(
+            CONSULTAS_INSERTAR_ACTIVIDADES[etiqueta],
+            unidad=unidad_nombre,
+            nombres=nombres,
+            database_=NEO4J_DATABASE,
+        )
+        creados = resumen.counters.relationships_created
+    except Exception as e:
+        logger.error("Error procesando %ss de %s: %s", tipo_archivo, unidad_nombre, e)
         return 0
+
+    logger.info("%s: %s %ss nuevos de %s del paralelo %s", unidad_nombre, creados, tipo_archivo, len(nombres), paralelo_objetivo)
+    return len(nombres)
+
+
+def procesar_unidad(
+    driver: Driver,
+    unidad_nombre: str,
+    nombres_unidad: Dict[str, List[str]],
+    paralelo_objetivo: str
+) -> Tuple[int, int]:
+    """
+    Inserta los cuestionarios y ayudantías de una unidad con execute_query.
+    
+    Pensada para ejecutarse en un hilo del pool de procesar_cuestionarios_y_ayudantias.
     
-    archivos_procesados = 0
-    for archivo in sorted(carpeta.iterdir()):
-        if archivo.is_file() and archivo.suffix.lower() == ".csv":
-            try:
-                logger.debug(f"Procesando {tipo_archivo}: {archivo.name}")
-                with driver.session() as session:
-                    session.execute_write(tx_funcion, unidad_nombre, archivo.name, paralelo_objetivo)
-                archivos_procesados += 1
-            except Exception as e:
-                logger.error(f"Error procesando {tipo_archivo} {archivo.name}: {e}")
-                continue
-                
-    return archivos_procesados
+    Args:
+        driver: Driver de conexión a Neo4J (compartido entre hilos)
+        unidad_nombre: Nombre de la unidad
+        nombres_unidad: Entrada de la unidad en asignar_actividades()
+        paralelo_objetivo: Paralelo específico a procesar
+        
+    Returns:
+        Tuple[int, int]: (cuestionarios procesados, ayudantías procesadas)
+    """
+    logger.info("Procesando unidad: %s", unidad_nombre)
+
+    procesados: Dict[str, int] = {}
+    for tipo_archivo, (subcarpeta, etiqueta) in TIPOS_ACTIVIDAD.items():
+        nombres = nombres_unidad.get(subcarpeta)
+        if nombres is None:
+            logger.warning("Carpeta de %s no encontrada en %s", tipo_archivo, unidad_nombre)
+            procesados[tipo_archivo] = 0
+            continue
+        procesados[tipo_archivo] = insertar_archivos_actividad(
+            etiqueta, driver, unidad_nombre, nombres, tipo_archivo, paralelo_objetivo
+        )
+
+    return procesados["cuestionario"], procesados["ayudantía"]
 
 
 # ==========================
@@ -395,25 +508,39 @@ def procesar_cuestionarios_y_ayudantias(driver: Driver, base_path: Union[str, Pa
         >>> procesar_cuestionarios_y_ayudantias(driver, "/ruta/actividades")
     """
     base = Path(base_path)
-    if not base.exists():
-        raise FileNotFoundError(f"La ruta base no existe: {base}")
+    # Un solo stat() para distinguir "no existe" de "no es un directorio"
+    try:
+        es_directorio = stat.S_ISDIR(os.stat(base).st_mode)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"La ruta base no existe: {base}") from None
     
-    if not base.is_dir():
+    if not es_directorio:
         raise FileNotFoundError(f"La ruta base no es un directorio: {base}")
 
+    # Un solo recorrido de las carpetas: sirve para elegir el paralelo y
+    # luego para insertar, sin volver a listar cada carpeta
+    inventario = inventariar_actividades(base)
+
     # ✅ ENCONTRAR PARALELO COMPLETO
-    paralelo_objetivo = encontrar_paralelo_completo(base, 33, 14)
+    paralelo_objetivo = encontrar_paralelo_completo(base, 33, 14, inventario)
     
     if not paralelo_objetivo:
         raise ValueError("No se encontró un paralelo con la cantidad exacta de actividades")
     
     print(f"Procesando actividades del paralelo: {paralelo_objetivo}")
 
-    logger.info(f"Iniciando procesamiento de cuestionarios y ayudantías en: {base}")
-    
-    carpetas_unidad = encontrar_carpeta_unidades(base)
+    logger.info("Iniciando procesamiento de cuestionarios y ayudantías en: %s", base)
+
+    # Los MERGE por nombre necesitan los índices aunque este módulo se use
+    # fuera de rellenarGrafo; IF NOT EXISTS hace que repetirlo sea inocuo.
+    # Si fallan, los hilos siguen siendo seguros: cada uno escribe una Unidad
+    # distinta y nombres que asignar_actividades no repite entre unidades
+    try:
+        crear_restricciones_esquema(driver)
+    except Exception as e:
+        logger.warning("No se pudieron verificar las restricciones de esquema: %s", e)
     
-    if not carpetas_unidad:
+    if not inventario:
         error_msg = f"No se encontraron carpetas de Unidad en: {base}"
         logger.error(error_msg)
         raise ValueError(error_msg)
@@ -421,25 +548,25 @@ def procesar_cuestionarios_y_ayudantias(driver: Driver, base_path: Union[str, Pa
     total_cuestionarios = 0
     total_ayudantias = 0
 
-    for carpeta_unidad in carpetas_unidad:
-        unidad_nombre = carpeta_unidad.name
-        logger.info(f"Procesando unidad: {unidad_nombre}")
+    # Cada actividad se asigna a una sola unidad antes de lanzar los hilos,
+    # para que el resultado no dependa del orden en que terminan
+    asignacion = asignar_actividades(inventario, paralelo_objetivo)
 
-        # Procesar cuestionarios
-        cuestionarios_dir = carpeta_unidad / "Cuestionarios"
-        cuestionarios_procesados = procesar_archivos_en_carpeta(
-            insertar_cuestionario, driver, unidad_nombre, cuestionarios_dir, "cuestionario", paralelo_objetivo
-        )
-        total_cuestionarios += cuestionarios_procesados
-
-        # Procesar ayudantías
-        ayudantias_dir = carpeta_unidad / "Ayudantías"
-        ayudantias_procesadas = procesar_archivos_en_carpeta(
-            insertar_ayudantia, driver, unidad_nombre, ayudantias_dir, "ayudantía", paralelo_objetivo
-        )
-        total_ayudantias += ayudantias_procesadas
+    # Con la asignación hecha las unidades son independientes: una tarea por
+    # unidad; las tareas solo comparten el driver, que es thread-safe
+    # (execute_query toma su sesión)
+    hilos = min(MAX_HILOS_UNIDADES, len(asignacion))
+    with ThreadPoolExecutor(max_workers=hilos) as executor:
+        futuros = [
+            executor.submit(procesar_unidad, driver, unidad_nombre, nombres_unidad, paralelo_objetivo)
+            for unidad_nombre, nombres_unidad in asignacion.items()
+        ]
+        for futuro in as_completed(futuros):
+            cuestionarios_procesados, ayudantias_procesadas = futuro.result()
+            total_cuestionarios += cuestionarios_procesados
+            total_ayudantias += ayudantias_procesadas
 
-    logger.info(f"Procesamiento completado: {total_cuestionarios} cuestionarios, {total_ayudantias} ayudantías procesados del paralelo {paralelo_objetivo}")
+    logger.info("Procesamiento completado: %s cuestionarios, %s ayudantías procesados del paralelo %s", total_cuestionarios, total_ayudantias, paralelo_objetivo)
 
 
 # ==========================
@@ -473,22 +600,23 @@ def contar_cuestionarios_y_ayudantias(driver: Driver) -> dict[str, int]:
         - Retorna 0 para ambos valores en caso de error (fail-safe)
         - Útil para validación post-procesamiento
     """
-    with driver.session() as session:
+    with driver.session(database=NEO4J_DATABASE) as session:
         try:
-            # Contar cuestionarios
-            result_cuestionarios = session.run("MATCH (c:Cuestionario) RETURN count(c) as total")
-            record_c = result_cuestionarios.single()
-            total_cuestionarios: int = record_c["total"] if record_c else 0
-            
-            # Contar ayudantías
-            result_ayudantias = session.run("MATCH (a:Ayudantia) RETURN count(a) as total")
-            record_a = result_ayudantias.single()
-            total_ayudantias: int = record_a["total"] if record_a else 0
+            # Ambos conteos en una sola consulta (un viaje de ida y vuelta);
+            # cada subconsulta cuenta su etiqueta por separado
+            result = session.run("""
+                CALL { MATCH (c:Cuestionario) RETURN count(c) as cuestionarios }
+                CALL { MATCH (a:Ayudantia) RETURN count(a) as ayudantias }
+                RETURN cuestionarios, ayudantias
+            """)
+            record = result.single()
+            total_cuestionarios: int = record["cuestionarios"] if record else 0
+            total_ayudantias: int = record["ayudantias"] if record else 0
             
             return {
                 "cuestionarios": total_cuestionarios,
                 "ayudantias": total_ayudantias
             }
         except Exception as e:
-            logger.error(f"Error contando cuestionarios y ayudantías: {e}")
+            logger.error("Error contando cuestionarios y ayudantías: %s", e)
             return {"cuestionarios": 0, "ayudantias": 0}
\ No newline at end of file
@@ -7,8 +7,12 @@ Procesa la estructura de carpetas del sistema de archivos y la refleja en la bas
 
 Funciones principales:
     - procesar_unidades_y_raps: Proceso principal de inserción masiva
+    - procesar_unidad_material: Inserción de una unidad y sus RAPs (un hilo por unidad)
     - insertar_unidad: Inserción individual de unidades
     - insertar_rap: Inserción individual de RAPs con relaciones
+    - insertar_raps_batch: Inserción de todos los RAPs de una unidad en una
+      sola consulta (UNWIND)
+    - insertar_unidad_con_raps: Unidad y RAPs en una sola transacción
     - validar_estructura_carpetas: Validación de estructura de directorios
     - limpiar_unidades_y_raps: Limpieza de datos existentes
 
@@ -30,14 +34,29 @@ Estructura de carpetas esperada:
     │       └── RAP_3.pdf
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 from neo4j import Driver, ManagedTransaction
 import logging
 
+from Neo4J.conn import NEO4J_DATABASE, crear_restricciones_esquema
+
 # Configuración de logging para seguimiento de operaciones
 logger = logging.getLogger(__name__)
 
+# Unidades procesadas en paralelo (cada hilo abre su propia sesión del pool)
+MAX_HILOS_UNIDADES = 8
+
+# Inserción de todos los RAPs de una unidad con un solo UNWIND
+CONSULTA_INSERTAR_RAPS = """
+    MATCH (u:Unidad {nombre: $unidad})
+    UNWIND $raps AS rap
+    MERGE (r:RAP {nombre: rap})
+    MERGE (u)-[:TIENE_RAP]->(r)
+"""
+
 
 # ==========================
 # Insertar Unidad
@@ -140,6 +159,61 @@ def insertar_rap(tx: ManagedTransaction, nombre_unidad: str, nombre_rap: str) ->
         raise
 
 
+def insertar_raps_batch(tx: ManagedTransaction, nombre_unidad: str, nombres_rap: List[str]) -> int:
+    """
+    Inserta todos los RAPs de una unidad y sus relaciones con un solo UNWIND.
+    
+    Reemplaza una transacción por RAP por una por unidad: el commit, que
+    domina el costo, se paga una vez.
+    
+    Args:
+        tx: Transacción activa de Neo4J para ejecutar la operación
+        nombre_unidad: Nombre de la unidad padre (debe existir previamente)
+        nombres_rap: Nombres de los RAPs de la unidad
+        
+    Returns:
+        int: Número de relaciones (Unidad)-[:TIENE_RAP]->(RAP) creadas
+        
+    Example:
+        >>> with driver.session() as session:
+        ...     session.execute_write(insertar_raps_batch, "Unidad_01", ["RAP_1", "RAP_2"])
+        2
+        
+    Note:
+        - Si la unidad no existe no se crea nada
+        - Operación idempotente: repetirla no crea duplicados
+    """
+    if not nombres_rap:
+        return 0
+    resumen = tx.run(CONSULTA_INSERTAR_RAPS, unidad=nombre_unidad, raps=nombres_rap).consume()
+    return resumen.counters.relationships_created
+
+
+def insertar_unidad_con_raps(tx: ManagedTransaction, nombre_unidad: str, nombres_rap: List[str]) -> int:
+    """
+    Inserta una Unidad y todos sus RAPs dentro de una misma transacción.
+    
+    Usada con session.execute_write, la unidad completa se confirma (o se
+    revierte y reintenta) de una vez: un commit por unidad en lugar de uno
+    para la unidad y otro para sus RAPs.
+    
+    Args:
+        tx: Transacción activa de Neo4J para ejecutar la operación
+        nombre_unidad: Nombre de la unidad a insertar/validar
+        nombres_rap: Nombres de los RAPs de la unidad (puede ser vacía)
+        
+    Returns:
+        int: Número de relaciones (Unidad)-[:TIENE_RAP]->(RAP) creadas
+        
+    Example:
+        >>> with driver.session() as session:
+        ...     session.execute_write(insertar_unidad_con_raps, "Unidad_01", ["RAP_1"])
+        1
+    """
+    insertar_unidad(tx, nombre_unidad)
+    return insertar_raps_batch(tx, nombre_unidad, nombres_rap)
+
+
 # ==========================
 # Validar estructura de carpetas
 # ==========================
@@ -171,16 +245,17 @@ def validar_estructura_carpetas(base_path: Path) -> List[Path]:
         - Solo incluye directorios, ignora archivos
         - Orden natural según iteración del sistema de archivos
     """
-    if not base_path.exists():
-        raise FileNotFoundError(f"La ruta base no existe: {base_path}")
-    
-    if not base_path.is_dir():
-        raise FileNotFoundError(f"La ruta base no es un directorio: {base_path}")
-
-    carpetas_unidad = [
-        carpeta for carpeta in base_path.iterdir() 
-        if carpeta.is_dir() and carpeta.name.lower().startswith("unidad")
-    ]
+    # La propia lectura valida la ruta: sin exists() ni is_dir() previos
+    try:
+        with os.scandir(base_path) as entradas:
+            carpetas_unidad = [
+                Path(entrada.path) for entrada in entradas
+                if entrada.name.lower().startswith("unidad") and entrada.is_dir()
+            ]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"La ruta base no existe: {base_path}") from None
+    except NotADirectoryError:
+        raise FileNotFoundError(f"La ruta base no es un directorio: {base_path}") from None
     
     if not carpetas_unidad:
         raise ValueError(f"No se encontraron carpetas de Unidad en: {base_path}")
@@ -213,7 +288,8 @@ def encontrar_carpeta_rap(carpeta_unidad: Path) -> Optional[Path]:
         - Retorna None si no existe la carpeta RAP
     """
     rap_folder = carpeta_unidad / "RAP"
-    if rap_folder.exists() and rap_folder.is_dir():
+    # is_dir() ya es False si la ruta no existe: un solo stat()
+    if rap_folder.is_dir():
         return rap_folder
     return None
 
@@ -238,26 +314,70 @@ def obtener_archivos_rap(carpeta_rap: Path) -> List[str]:
         
     Note:
         - Excluye archivos que comiencen con '.' (ocultos)
-        - Usa .stem para remover extensiones de archivo
+        - Remueve la extensión como .stem, recortando en el último '.'
         - Incluye todos los tipos de archivo no ocultos
     """
-    return [
-        archivo.stem for archivo in carpeta_rap.iterdir() 
-        if archivo.is_file() and not archivo.name.startswith('.')
-    ]
+    nombres: List[str] = []
+    # os.scandir entrega nombres y tipo de entrada sin crear un Path por archivo
+    with os.scandir(carpeta_rap) as entradas:
+        for entrada in entradas:
+            nombre = entrada.name
+            if nombre.startswith('.') or not entrada.is_file():
+                continue
+            # Nombre sin extensión (como Path.stem, sin construir un Path)
+            punto = nombre.rfind('.')
+            nombres.append(nombre[:punto] if punto > 0 else nombre)
+    return nombres
 
 
 # ==========================
 # Procesar Unidades y RAPs
 # ==========================
 
+def procesar_unidad_material(driver: Driver, carpeta_unidad: Path) -> Optional[int]:
+    """
+    Inserta una unidad y los RAPs de su carpeta RAP en una sola transacción.
+    
+    Pensada para ejecutarse en un hilo del pool de procesar_unidades_y_raps:
+    abre su propia sesión, ya que las sesiones no son thread-safe (el driver sí).
+    
+    Args:
+        driver: Driver de conexión a Neo4J (compartido entre hilos)
+        carpeta_unidad: Path del directorio de la unidad
+        
+    Returns:
+        Optional[int]: Número de RAPs procesados, o None si la unidad falló
+        
+    Note:
+        - Los errores se registran y no se propagan, para no detener al
+          resto de unidades
+    """
+    try:
+        # Buscar la carpeta RAP antes de abrir la transacción
+        carpeta_rap = encontrar_carpeta_rap(carpeta_unidad)
+        archivos_rap = obtener_archivos_rap(carpeta_rap) if carpeta_rap else []
+        if not carpeta_rap:
+            logger.warning(f"⚠️ Carpeta RAP no encontrada en {carpeta_unidad.name}")
+
+        # Insertar la Unidad y sus RAPs en una sola transacción
+        with driver.session(database=NEO4J_DATABASE) as session:
+            creados = session.execute_write(insertar_unidad_con_raps, carpeta_unidad.name, archivos_rap)
+        if carpeta_rap:
+            logger.info(f"   📘 {carpeta_unidad.name}: {len(archivos_rap)} RAPs ({creados} relaciones nuevas)")
+        return len(archivos_rap)
+
+    except Exception as e:
+        logger.error(f"❌ Error procesando unidad {carpeta_unidad.name}: {e}")
+        return None
+
+
 def procesar_unidades_y_raps(driver: Driver, base_path: Path) -> None:
     """
     Procesa todas las carpetas de Unidad y sus RAPs, insertándolos en Neo4J.
     
     Esta es la función principal del módulo que orquesta todo el proceso:
-    1. 🔍 Valida la estructura de carpetas base
-    2. 📁 Procesa cada unidad encontrada
+    1. 🔍 Valida la estructura de carpetas base y las restricciones de esquema
+    2. 📁 Procesa las unidades en paralelo (procesar_unidad_material)
     3. 📚 Inserta unidades en la base de datos
     4. 📘 Busca y procesa RAPs dentro de cada unidad
     5. 📊 Genera reporte final del proceso
@@ -282,7 +402,7 @@ def procesar_unidades_y_raps(driver: Driver, base_path: Path) -> None:
         
     Note:
         - Proceso continuo: errores en una unidad no detienen el proceso completo
-        - Operaciones atómicas por unidad
+        - Operaciones atómicas por unidad: una transacción (unidad + RAPs)
         - Logging detallado de progreso y errores
     """
     logger.info(f"🔍 Iniciando procesamiento de unidades en: {base_path}")
@@ -293,30 +413,33 @@ def procesar_unidades_y_raps(driver: Driver, base_path: Path) -> None:
         logger.error(f"❌ Error validando estructura: {e}")
         raise
 
+    # Los MERGE por nombre necesitan las restricciones de unicidad de Unidad
+    # y RAP (índice y, con hilos concurrentes, sin duplicados) aunque este
+    # módulo se use fuera de rellenarGrafo; IF NOT EXISTS las hace inocuas.
+    # Un mismo RAP puede aparecer en varias unidades: sin la restricción, dos
+    # hilos podrían crearlo dos veces, así que se procesa en secuencia
+    hilos = min(MAX_HILOS_UNIDADES, len(carpetas_unidad))
+    try:
+        crear_restricciones_esquema(driver)
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudieron verificar las restricciones de esquema, unidades en secuencia: {e}")
+        hilos = 1
+
     unidades_procesadas = 0
     raps_procesados = 0
 
-    with driver.session() as session:
-        for carpeta_unidad in carpetas_unidad:
-            try:
-                # Insertar la Unidad
-                session.execute_write(insertar_unidad, carpeta_unidad.name)
+    # Las unidades tocan nodos Unidad distintos, así que sus escrituras no
+    # compiten por bloqueos: una tarea por unidad, cada una con su sesión
+    with ThreadPoolExecutor(max_workers=hilos) as executor:
+        futuros = [
+            executor.submit(procesar_unidad_material, driver, carpeta_unidad)
+            for carpeta_unidad in carpetas_unidad
+        ]
+        for futuro in as_completed(futuros):
+            raps_unidad = futuro.result()
+            if raps_unidad is not None:
                 unidades_procesadas += 1
-
-                # Buscar y procesar carpeta RAP
-                carpeta_rap = encontrar_carpeta_rap(carpeta_unidad)
-                if carpeta_rap:
-                    archivos_rap = obtener_archivos_rap(carpeta_rap)
-                    for nombre_rap in archivos_rap:
-                        session.execute_write(insertar_rap, carpeta_unidad.name, nombre_rap)
-                        raps_procesados += 1
-                else:
-                    logger.warning(f"⚠️ Carpeta RAP no encontrada en {carpeta_unidad.name}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Error procesando unidad {carpeta_unidad.name}: {e}")
-                # Continuar con la siguiente unidad en lugar de fallar completamente
-                continue
+                raps_procesados += raps_unidad
 
     logger.info(f"✅ Procesamiento completado: {unidades_procesadas} unidades, {raps_procesados} RAPs procesados")
 
@@ -350,7 +473,7 @@ def limpiar_unidades_y_raps(driver: Driver) -> None:
         - Elimina TODAS las unidades y RAPs existentes
         - Útil solo para testing o reset completo
     """
-    with driver.session() as session:
+    with driver.session(database=NEO4J_DATABASE) as session:
         try:
             result = session.run(
                 """
@@ -9,12 +9,25 @@ Variables de entorno requeridas:
     - NEO4J_USER: Usuario de Neo4j
     - NEO4J_PASSWORD: Contraseña de Neo4j
 
+Variables de entorno opcionales:
+    - NEO4J_DATABASE: Base de datos usada por todas las sesiones (ej: neo4j).
+      Indicarla evita que el driver resuelva la base por defecto del usuario
+      al abrir cada sesión.
+    - NEO4J_MAX_POOL_SIZE: Conexiones máximas del pool (default: 50)
+    - NEO4J_ACQUISITION_TIMEOUT: Segundos de espera por una conexión libre (default: 60)
+    - NEO4J_MAX_RETRY_TIME: Segundos máximos de reintento de transacciones (default: 30)
+
 Funciones principales:
     - obtener_driver(): Devuelve instancia singleton del driver
     - driver_context(): Context manager para conexiones temporales
     - verificar_conexion(): Verifica estado de la conexión
     - obtener_estado_base_datos(): Obtiene información de la BD
     - cerrar_driver(): Cierra el driver y libera recursos
+    - crear_restricciones_esquema(): Crea restricciones e índices usados por la carga
+
+Plugins recomendados:
+    - APOC: obtener_estadisticas_bd() usa apoc.meta.stats() para leer los
+      conteos del grafo sin recorrerlo. Sin APOC se usan alternativas más lentas.
 
 Buenas prácticas:
     - Usar driver_context() en scripts pequeños
@@ -26,7 +39,7 @@ import os
 import logging
 import atexit
 from contextlib import contextmanager
-from typing import Generator, Optional, Any
+from typing import Generator, List, Optional, Any
 
 from neo4j import GraphDatabase, Driver
 from dotenv import load_dotenv
@@ -68,9 +81,38 @@ def _obtener_variables_entorno() -> tuple[str, str, str]:
     return uri, user, password  # type: ignore
 
 
+def _numero_entorno(nombre: str, defecto: float) -> float:
+    """
+    Lee una variable de entorno numérica, usando `defecto` si falta o es inválida.
+    
+    Args:
+        nombre: Nombre de la variable de entorno
+        defecto: Valor a usar si la variable no está definida o no es numérica
+        
+    Returns:
+        float: Valor leído o el valor por defecto
+    """
+    valor = os.getenv(nombre)
+    if not valor:
+        return defecto
+    try:
+        return float(valor)
+    except ValueError:
+        logger.warning(f"⚠️ {nombre}={valor!r} no es numérico, usando {defecto}")
+        return defecto
+
+
 # Cargar variables una vez al importar el módulo
 NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD = _obtener_variables_entorno()
 
+# Ajustes del pool de conexiones (sobreescribibles por entorno)
+NEO4J_MAX_POOL_SIZE = int(_numero_entorno("NEO4J_MAX_POOL_SIZE", 50))
+NEO4J_ACQUISITION_TIMEOUT = _numero_entorno("NEO4J_ACQUISITION_TIMEOUT", 60.0)
+NEO4J_MAX_RETRY_TIME = _numero_entorno("NEO4J_MAX_RETRY_TIME", 30.0)
+
+# Base de datos explícita para driver.session(database=...); None = la del servidor
+NEO4J_DATABASE: Optional[str] = os.getenv("NEO4J_DATABASE") or None
+
 # Driver singleton (se inicializa solo una vez)
 _driver: Optional[Driver] = None
 
@@ -81,6 +123,9 @@ def obtener_driver() -> Driver:
     
     Si el driver no existe o está desconectado, crea uno nuevo con 
     configuración optimizada para aplicaciones largas.
+    
+    El servidor debería tener APOC instalado (ver docstring del módulo) para
+    que las estadísticas de la carga se lean desde los contadores del store.
 
     Returns:
         Driver: Instancia del driver de Neo4j configurado y verificado
@@ -104,8 +149,12 @@ def obtener_driver() -> Driver:
                 NEO4J_URI, 
                 auth=(NEO4J_USER, NEO4J_PASSWORD),
                 max_connection_lifetime=3600,   # 1 hora
-                connection_acquisition_timeout=60,  # 60 segundos
+                max_connection_pool_size=NEO4J_MAX_POOL_SIZE,  # fases de inserción concurrentes
+                connection_acquisition_timeout=NEO4J_ACQUISITION_TIMEOUT,
                 connection_timeout=30,  # 30 segundos
+                max_transaction_retry_time=NEO4J_MAX_RETRY_TIME,  # reintentos de execute_read/write
+                keep_alive=True,  # evita cierres por inactividad en cargas largas
+                fetch_size=10_000,  # registros por lote al leer resultados
             )
             _driver.verify_connectivity()
             logger.info("✅ Driver de Neo4j creado y conectado exitosamente.")
@@ -193,7 +242,7 @@ def verificar_conexion(timeout: int = 5) -> bool:
     """
     try:
         driver = obtener_driver()
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run("RETURN 1 as connection_test", 
                                timeout=timeout * 1000)
             single_result = result.single()
@@ -213,7 +262,7 @@ def obtener_estado_base_datos() -> dict[str, Any]:
     """
     try:
         driver = obtener_driver()
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             # Información básica de la base de datos
             result = session.run("""
                 CALL dbms.components() 
@@ -251,5 +300,40 @@ def obtener_estado_base_datos() -> dict[str, Any]:
         }
 
 
+# Restricciones de unicidad sobre las claves usadas por los MERGE/MATCH de la carga.
+# Cada restricción crea su índice, por lo que las búsquedas dejan de recorrer
+# todos los nodos de la etiqueta.
+RESTRICCIONES_ESQUEMA: List[str] = [
+    "CREATE CONSTRAINT alumno_correo IF NOT EXISTS FOR (a:Alumno) REQUIRE a.correo IS UNIQUE",
+    "CREATE CONSTRAINT unidad_nombre IF NOT EXISTS FOR (u:Unidad) REQUIRE u.nombre IS UNIQUE",
+    "CREATE CONSTRAINT rap_nombre IF NOT EXISTS FOR (r:RAP) REQUIRE r.nombre IS UNIQUE",
+    "CREATE CONSTRAINT cuestionario_nombre IF NOT EXISTS FOR (c:Cuestionario) REQUIRE c.nombre IS UNIQUE",
+    "CREATE CONSTRAINT ayudantia_nombre IF NOT EXISTS FOR (a:Ayudantia) REQUIRE a.nombre IS UNIQUE",
+    # Índice simple (no único): las consultas por paralelo filtran MATCH (a:Alumno {paralelo: $paralelo})
+    "CREATE INDEX alumno_paralelo IF NOT EXISTS FOR (a:Alumno) ON (a.paralelo)",
+]
+
+
+def crear_restricciones_esquema(driver: Optional[Driver] = None) -> None:
+    """
+    Crea las restricciones de unicidad (e índices asociados) y los índices del grafo.
+    
+    Debe ejecutarse antes de cualquier MERGE masivo para que las búsquedas
+    sobre Alumno, Unidad, RAP, Cuestionario y Ayudantia usen índice. Es
+    idempotente gracias a IF NOT EXISTS, por lo que cada punto de entrada de
+    la carga puede llamarla sin coordinarse con los demás.
+    
+    Args:
+        driver: Driver a usar. Defaults to obtener_driver()
+        
+    Raises:
+        Exception: Si Neo4J rechaza alguna de las sentencias
+    """
+    driver = driver or obtener_driver()
+    # execute_query gestiona sesión y transacción por sentencia
+    for restriccion in RESTRICCIONES_ESQUEMA:
+        driver.execute_query(restriccion, database_=NEO4J_DATABASE)
+
+
 # Cleanup automático al finalizar el programa
 atexit.register(cerrar_driver)
\ No newline at end of file
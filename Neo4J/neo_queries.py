@@ -28,7 +28,7 @@ from typing import List, Dict, Any, Optional, Callable, cast
 
 from neo4j import Driver
 
-from Neo4J.conn import obtener_driver
+from Neo4J.conn import NEO4J_DATABASE, obtener_driver
 
 # Define type aliases for better clarity
 ActivityDict = Dict[str, Any]
@@ -55,7 +55,7 @@ def fetch_alumnos() -> List[Dict[str, str]]:
     ORDER BY a.nombre
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher)
             alumnos: List[Dict[str, str]] = [
                 {"correo": str(record["correo"]), "nombre": str(record["nombre"])}
@@ -83,7 +83,7 @@ def fetch_alumnos_por_paralelo(paralelo: str) -> List[Dict[str, str]]:
     ORDER BY a.nombre
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, paralelo=paralelo)
             alumnos: List[Dict[str, str]] = [
                 {"correo": str(record["correo"]), "nombre": str(record["nombre"])}
@@ -115,7 +115,7 @@ def fetch_progreso_alumno(correo: str) -> List[Dict[str, Any]]:
            r.score AS score, r.estado AS estado_raw
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, correo=correo)
             progreso: List[Dict[str, Any]] = []
 
@@ -302,7 +302,7 @@ def fetch_siguiente_actividad_mejorada(correo: str) -> Optional[Dict[str, Any]]:
     """
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             record = session.run(cypher, correo=correo).single()
             if not record:
                 return None
@@ -342,7 +342,7 @@ def fetch_siguiente_actividad_simple(correo: str) -> Optional[Dict[str, Any]]:
     """
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             record = session.run(cypher, correo=correo).single()
             if not record:
                 return None
@@ -399,7 +399,7 @@ def fetch_estadisticas_globales() -> Dict[str, Dict[str, Dict[str, Any]]]:
     """
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher)
             estadisticas: Dict[str, Dict[str, Dict[str, Any]]] = {}
             for record in result:
@@ -449,7 +449,7 @@ def fetch_estadisticas_alumno(correo: str) -> Dict[str, Any]:
     """
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, correo=correo)
             
             actividades_dict: Dict[str, Dict[str, Any]] = {}
@@ -525,7 +525,7 @@ def fetch_verificar_alumno_perfecto(correo: str) -> bool:
     """
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, correo=correo)
             record = result.single()
             return record["todo_perfecto"] if record else False
@@ -584,7 +584,7 @@ def fetch_actividades_lentas_alumno(correo: str) -> List[Dict[str, Any]]:
     """
     
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, correo=correo)
             actividades_lentas: List[Dict[str, Any]] = []
             
@@ -627,7 +627,7 @@ def fetch_paralelos_disponibles() -> List[Dict[str, str]]:
     ORDER BY a.paralelo
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher)
             paralelos: List[Dict[str, str]] = [
                 {"paralelo": str(record["paralelo"])}
@@ -680,7 +680,7 @@ def fetch_estadisticas_completitud_paralelo(paralelo: str) -> Dict[str, Any]:
         (sum(alumnos_completados) * 100.0) / (total_actividades * total_alumnos) as porcentaje_completitud_global
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, paralelo=paralelo)
             record = result.single()
             
@@ -746,7 +746,7 @@ def fetch_actividades_baja_participacion(paralelo: str, umbral_participacion: fl
     ORDER BY porcentaje_participacion ASC
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             umbral_porcentaje = umbral_participacion * 100
             result = session.run(cypher, paralelo=paralelo, umbral_porcentaje=umbral_porcentaje)
             
@@ -815,7 +815,7 @@ def fetch_actividades_eficiencia_paralelo(paralelo: str, top_n: int = 3) -> Dict
     ORDER BY eficiencia DESC
     """
     try:
-        with driver.session() as session:
+        with driver.session(database=NEO4J_DATABASE) as session:
             result = session.run(cypher, paralelo=paralelo)
             todas_actividades: List[Dict[str, Any]] = []
             